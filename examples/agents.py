@@ -1,5 +1,7 @@
 # examples/agents.py
 
+import asyncio
+
 from dotenv import load_dotenv
 from dust_client import DustClient, DustConfig, DustAPIError
 
@@ -12,41 +14,30 @@ client = DustClient(config)
 client.validate()
 
 
-def list_agents() -> None:
-    try:
-        agents = client.agents.list()
-        print(agents)
-        print(f"Found {len(agents)} agents")
-        for a in agents:
-            print("-", a.name, f"(sId={a.sId})")
-    except DustAPIError as e:
-        print("Dust API error:", e)
-        if e.details:
-            print("Details:", e.details)
+def print_api_error(e: DustAPIError) -> None:
+    print("Dust API error:", e)
+    if e.details:
+        print("Details:", e.details)
 
 
-def get_agent(agent_id: str) -> None:
-    try:
-        agent = client.agents.get(agent_id)
-        print(agent)
-    except DustAPIError as e:
-        print("Dust API error:", e)
-        if e.details:
-            print("Details:", e.details)
+async def main() -> None:
+    # The three reads are independent: run them concurrently so the total
+    # latency is that of the slowest call instead of the sum of all three.
+    results = await asyncio.gather(
+        client.agents.alist(),
+        client.agents.aget("i5cIwRsG0u"),
+        client.agents.asearch(q="promptWriter"),
+        return_exceptions=True,
+    )
 
+    for result in results:
+        if isinstance(result, DustAPIError):
+            print_api_error(result)
+        else:
+            print(result)
 
-def search_agent_by_name(name: str) -> None:
-    try:
-        agents = client.agents.search(q=name)
-        print(agents)
-    except DustAPIError as e:
-        print("Dust API error:", e)
-        if e.details:
-            print("Details:", e.details)
+    await client.aclose()
 
 
 if __name__ == "__main__":
-    list_agents()
-    get_agent("i5cIwRsG0u")
-    client.agents.get("i5cIwRsG0")
-    search_agent_by_name("promptWriter")
+    asyncio.run(main())
@@ -1,18 +1,45 @@
-from .client import DustClient
-from .config import DustConfig
-from .exceptions import (
-    DustError,
-    DustAPIError,
-    DustBadRequestError,
-    DustUnauthorizedError,
-    DustForbiddenError,
-    DustNotFoundError,
-    DustConflictError,
-    DustRateLimitError,
-    DustServerError,
-)
-from .chat.client import ChatClient, ChatSession
-from .chat.models import ChatMessage, ChatResponse
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names are resolved lazily (PEP 562) so that e.g.
+# `from dust_client import DustConfig` doesn't import httpx and every
+# sub-client. Each entry maps a name to (module, attribute).
+_LAZY = {
+    "DustClient": ("dust_client.client", "DustClient"),
+    "DustConfig": ("dust_client.config", "DustConfig"),
+    "DustError": ("dust_client.exceptions", "DustError"),
+    "DustAPIError": ("dust_client.exceptions", "DustAPIError"),
+    "DustBadRequestError": ("dust_client.exceptions", "DustBadRequestError"),
+    "DustUnauthorizedError": ("dust_client.exceptions", "DustUnauthorizedError"),
+    "DustForbiddenError": ("dust_client.exceptions", "DustForbiddenError"),
+    "DustNotFoundError": ("dust_client.exceptions", "DustNotFoundError"),
+    "DustConflictError": ("dust_client.exceptions", "DustConflictError"),
+    "DustRateLimitError": ("dust_client.exceptions", "DustRateLimitError"),
+    "DustServerError": ("dust_client.exceptions", "DustServerError"),
+    "ChatClient": ("dust_client.chat.client", "ChatClient"),
+    "ChatSession": ("dust_client.chat.client", "ChatSession"),
+    "ChatMessage": ("dust_client.chat.models", "ChatMessage"),
+    "ChatResponse": ("dust_client.chat.models", "ChatResponse"),
+}
+
+if TYPE_CHECKING:
+    from .client import DustClient
+    from .config import DustConfig
+    from .exceptions import (
+        DustError,
+        DustAPIError,
+        DustBadRequestError,
+        DustUnauthorizedError,
+        DustForbiddenError,
+        DustNotFoundError,
+        DustConflictError,
+        DustRateLimitError,
+        DustServerError,
+    )
+    from .chat.client import ChatClient, ChatSession
+    from .chat.models import ChatMessage, ChatResponse
 
 __all__ = [
     "DustClient",
@@ -31,3 +58,19 @@ __all__ = [
     "ChatMessage",
     "ChatResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache on the module so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
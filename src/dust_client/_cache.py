@@ -0,0 +1,138 @@
+# dust_client/_cache.py
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+__all__ = ["MISSING", "TTLCache", "SingleFlight"]
+
+# Sentinel returned by TTLCache.get on a miss (None is a valid cached value).
+MISSING: Any = object()
+
+
+class TTLCache:
+    """
+    Minimal thread-safe in-process cache with a fixed time-to-live.
+
+    A `ttl` of 0 (or less) disables the cache: `get` always misses and `set`
+    is a no-op, so callers don't need to special-case the disabled state.
+    """
+
+    __slots__ = ("_ttl", "_data", "_lock")
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._data: Dict[Hashable, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def get(self, key: Hashable) -> Any:
+        if not self.enabled:
+            return MISSING
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self._ttl:
+                del self._data[key]
+                return MISSING
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            # Re-inserted so the dict stays ordered by store time, which lets
+            # expired entries be purged from the front: keys that are never
+            # read again don't pile up.
+            self._data.pop(key, None)
+            self._data[key] = (value, now)
+            expired = []
+            for old_key, (_, stored_at) in self._data.items():
+                if now - stored_at <= self._ttl:
+                    break
+                expired.append(old_key)
+            for old_key in expired:
+                del self._data[old_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one.
+
+    While a call for `key` is in flight, other callers with the same key wait
+    for its outcome (result or exception) instead of starting their own.
+    Nothing is remembered once the call completes; pair with TTLCache for
+    that.
+
+    Sync callers are coalesced across threads; async callers are coalesced
+    per event loop.
+    """
+
+    __slots__ = ("_lock", "_calls", "_acalls")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._acalls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], Any] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        loop_key = (loop, key)
+
+        task = self._acalls.get(loop_key)
+        if task is None:
+            # The call runs in its own task, so the caller that started it
+            # can be cancelled without failing the others.
+            task = self._acalls[loop_key] = asyncio.ensure_future(fn())
+            task.add_done_callback(functools.partial(self._aforget, loop_key))
+        # Shielded so that a cancelled caller doesn't cancel the call the
+        # other callers are waiting on.
+        return await asyncio.shield(task)
+
+    def _aforget(self, loop_key: Tuple[Any, Hashable], task: asyncio.Future) -> None:
+        if self._acalls.get(loop_key) is task:
+            del self._acalls[loop_key]
+        # There may be no caller left to retrieve it; don't log it as lost.
+        if not task.cancelled():
+            task.exception()
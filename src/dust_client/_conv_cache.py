@@ -0,0 +1,90 @@
+# dust_client/_conv_cache.py
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+__all__ = ["ConversationCache"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    workspace_id TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    title TEXT NOT NULL,
+    conversation_id TEXT NOT NULL,
+    PRIMARY KEY (workspace_id, agent, title)
+)
+"""
+
+
+class ConversationCache:
+    """
+    On-disk map of (workspace, agent, title) -> conversation sId, so that
+    `ChatClient.session(..., reuse=True)` can pick up the same conversation
+    across process restarts.
+
+    Backed by SQLite (WAL mode, autocommit). The database is opened on first
+    use; a missing parent directory is created.
+    """
+
+    __slots__ = ("_path", "_conn", "_lock")
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, workspace_id: str, agent: str, title: Optional[str]) -> Optional[str]:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT conversation_id FROM conversations"
+                    " WHERE workspace_id = ? AND agent = ? AND title = ?",
+                    (workspace_id, agent, title or ""),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def put(
+        self,
+        workspace_id: str,
+        agent: str,
+        title: Optional[str],
+        conversation_id: str,
+    ) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO conversations"
+                " (workspace_id, agent, title, conversation_id) VALUES (?, ?, ?, ?)",
+                (workspace_id, agent, title or "", conversation_id),
+            )
+
+    def discard(self, workspace_id: str, agent: str, title: Optional[str]) -> None:
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM conversations"
+                " WHERE workspace_id = ? AND agent = ? AND title = ?",
+                (workspace_id, agent, title or ""),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,91 @@
+# dust_client/_scope.py
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+__all__ = ["request_scope", "scoped", "ascoped", "invalidate", "map_in_scope"]
+
+# Active request scope, if any: a plain dict shared by every lookup made
+# while the scope is open.
+_SCOPE: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar(
+    "dust_request_scope", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[Dict[Hashable, Any]]:
+    """
+    Deduplicate repeated lookups (same agent, same conversation) made within
+    one logical operation.
+
+    Nested scopes reuse the outermost one. Outside of a scope, lookups always
+    hit the network.
+    """
+    scope = _SCOPE.get()
+    if scope is not None:
+        yield scope
+        return
+
+    scope = {}
+    token = _SCOPE.set(scope)
+    try:
+        yield scope
+    finally:
+        _SCOPE.reset(token)
+
+
+def scoped(key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """Return `fetch()`, memoized under `key` in the active request scope."""
+    scope = _SCOPE.get()
+    if scope is None:
+        return fetch()
+
+    if key not in scope:
+        scope[key] = fetch()
+    return scope[key]
+
+
+async def ascoped(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Async counterpart of `scoped`."""
+    scope = _SCOPE.get()
+    if scope is None:
+        return await fetch()
+
+    if key not in scope:
+        scope[key] = await fetch()
+    return scope[key]
+
+
+def invalidate(key: Hashable) -> None:
+    """Forget `key` in the active request scope (e.g. after a write)."""
+    scope = _SCOPE.get()
+    if scope is not None:
+        scope.pop(key, None)
+
+
+def map_in_scope(
+    pool: Executor, fn: Callable[[Any], Any], items: Iterable[Any]
+) -> List[Any]:
+    """
+    `pool.map(fn, items)`, with each call run in a copy of the caller's
+    context.
+
+    Pool threads don't inherit context variables, so without this the calls
+    would neither see nor invalidate the caller's request scope.
+    """
+    futures = [pool.submit(copy_context().run, fn, item) for item in items]
+    return [future.result() for future in futures]
@@ -0,0 +1,69 @@
+# dust_client/_sse.py
+
+from __future__ import annotations
+
+from typing import List
+
+__all__ = ["EventFramer"]
+
+
+class EventFramer:
+    """
+    Incremental framer for SSE / NDJSON byte streams.
+
+    Feed it raw chunks as they are read; it returns the JSON payload of every
+    complete line: blank lines and ":" keep-alive comments are dropped and
+    the SSE "data:" prefix is stripped.
+
+    Each chunk is searched once for its last newline (`bytes.rfind`) and its
+    complete lines are cut in a single `bytes.split`, so the per-byte work
+    stays in C and the Python loop only runs once per line. An incomplete
+    trailing line is kept as-is until the next newline arrives.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self) -> None:
+        # Pieces of the current, not yet newline-terminated line.
+        self._pending: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+
+        complete = chunk[:end]
+        if self._pending:
+            self._pending.append(complete)
+            complete = b"".join(self._pending)
+
+        rest = chunk[end + 1 :]
+        self._pending = [rest] if rest else []
+        return _payloads(complete.split(b"\n"))
+
+    def flush(self) -> List[bytes]:
+        """Payload of the last line, if the stream didn't end with a newline."""
+        tail = b"".join(self._pending)
+        self._pending = []
+        return _payloads([tail])
+
+
+def _payloads(lines: List[bytes]) -> List[bytes]:
+    payloads = []
+    for line in lines:
+        line = line.strip()
+
+        # Blank separators and ":" keep-alive comments.
+        if not line or line[:1] == b":":
+            continue
+
+        # SSE style: "data: {...}"; otherwise NDJSON (whole line is JSON).
+        if line.startswith(b"data:"):
+            line = line[5:].strip()
+            if not line:
+                continue
+
+        payloads.append(line)
+    return payloads
@@ -1,26 +1,87 @@
 # dust_client/agents/client.py
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Literal, List, Optional
 
 from pydantic import ValidationError
 
+from .._cache import MISSING, SingleFlight, TTLCache
+from .._scope import ascoped, invalidate, map_in_scope, scoped
 from ..exceptions import DustError
-from .models import AgentConfiguration, ListAgentsResponse, GetAgentResponse
+from .models import (
+    AgentConfiguration,
+    GetAgentResponse,
+    ListAgentsEnvelope,
+    ListAgentsResponse,
+)
 
 if TYPE_CHECKING:
     from ..client import DustClient
 
+_AGENT_CONFIGURATIONS = "/assistant/agent_configurations"
+_AGENT_CONFIGURATIONS_PREFIX = _AGENT_CONFIGURATIONS + "/"
+_AGENT_CONFIGURATIONS_SEARCH = _AGENT_CONFIGURATIONS + "/search"
+
 
 class AgentsClient:
     """
     Client for Dust Agent-related operations.
 
     Accessed via `DustClient.agents`.
+
+    Read calls (`list`, `get`, `search` and their async counterparts) can be
+    cached in-process by setting `DustConfig.agents_cache_ttl`. Concurrent
+    identical reads are always coalesced into a single request.
     """
 
     def __init__(self, client: "DustClient") -> None:
         self._client = client
+        self._cache = TTLCache(client.config.agents_cache_ttl)
+        self._inflight = SingleFlight()
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached agent response."""
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Cached reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> tuple:
+        return ("GET", path, frozenset(params.items()) if params else None)
+
+    def _fetch(self, path: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        key = self._cache_key(path, params)
+        raw = self._cache.get(key)
+        if raw is not MISSING:
+            return raw
+
+        def _load() -> bytes:
+            raw = self._client.workspace_request_bytes("GET", path, params=params)
+            self._cache.set(key, raw)
+            return raw
+
+        # Concurrent identical reads share one request.
+        return self._inflight.do(key, _load)
+
+    async def _afetch(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        key = self._cache_key(path, params)
+        raw = self._cache.get(key)
+        if raw is not MISSING:
+            return raw
+
+        async def _load() -> bytes:
+            raw = await self._client.aworkspace_request_bytes(
+                "GET", path, params=params
+            )
+            self._cache.set(key, raw)
+            return raw
+
+        return await self._inflight.ado(key, _load)
 
     # ------------------------------------------------------------------
     # List agents
@@ -32,31 +93,22 @@ class AgentsClient:
 
         GET /api/v1/w/{wId}/assistant/agent_configurations
         """
-        data = self._client.workspace_request(
-            "GET",
-            "/assistant/agent_configurations",
-        )
-
-        # Happy path: Dust returns the documented shape
-        if isinstance(data, dict) and "agentConfigurations" in data:
-            resp = ListAgentsResponse.model_validate(data)
-            return resp.agentConfigurations
-
-        # Fallbacks for robustness (in case Dust changes or tests mock differently)
-        if isinstance(data, list):
-            # API returned a bare list of agents
-            return [AgentConfiguration.model_validate(a) for a in data]
-
-        if isinstance(data, dict):
-            # Try a few other common wrapper keys
-            for key in ("agents", "agent_configurations", "data"):
-                value = data.get(key)
-                if isinstance(value, list):
-                    return [AgentConfiguration.model_validate(a) for a in value]
-
-        raise DustError(
-            f"Unexpected response type for AgentsClient.list: {type(data)!r}"
-        )
+        raw = self._fetch(_AGENT_CONFIGURATIONS)
+        return self._parse_list(raw)
+
+    async def alist(self) -> List[AgentConfiguration]:
+        """Async counterpart of `list`."""
+        raw = await self._afetch(_AGENT_CONFIGURATIONS)
+        return self._parse_list(raw)
+
+    @staticmethod
+    def _parse_list(raw: bytes) -> List[AgentConfiguration]:
+        # The documented shape and the fallbacks (bare list, other wrapper
+        # keys) are all handled by one validation pass from bytes.
+        try:
+            return ListAgentsEnvelope.model_validate_json(raw).as_list()
+        except ValidationError as exc:
+            raise DustError(f"Failed to parse list agents response: {exc}") from exc
 
     # ------------------------------------------------------------------
     # Get a single agent by sId
@@ -80,19 +132,79 @@ class AgentsClient:
 
         Returns:
             AgentConfiguration
+
+        Inside `DustClient.request_scope()`, repeated lookups of the same
+        agent are served from the scope.
         """
-        params = {"variant": variant} if variant else None
+        return scoped(("agent", s_id, variant), lambda: self._get(s_id, variant))
+
+    async def aget(
+        self,
+        s_id: str,
+        *,
+        variant: Literal["light", "full"] = "light",
+    ) -> AgentConfiguration:
+        """Async counterpart of `get`."""
+        return await ascoped(
+            ("agent", s_id, variant), lambda: self._aget(s_id, variant)
+        )
 
-        data = self._client.workspace_request(
-            "GET",
-            f"/assistant/agent_configurations/{s_id}",
-            params=params,
+    def _get(self, s_id: str, variant: Optional[str]) -> AgentConfiguration:
+        raw = self._fetch(
+            _AGENT_CONFIGURATIONS_PREFIX + s_id,
+            self._variant_params(variant),
         )
+        return self._parse_agent(raw, action="get")
 
+    async def _aget(self, s_id: str, variant: Optional[str]) -> AgentConfiguration:
+        raw = await self._afetch(
+            _AGENT_CONFIGURATIONS_PREFIX + s_id,
+            self._variant_params(variant),
+        )
+        return self._parse_agent(raw, action="get")
+
+    def get_many(
+        self,
+        s_ids: List[str],
+        *,
+        variant: Literal["light", "full"] = "light",
+        max_workers: int = 8,
+    ) -> List[AgentConfiguration]:
+        """
+        Retrieve several agent configurations concurrently.
+
+        The requests are fanned out over a thread pool and share the client's
+        connection pool, so total latency tracks the slowest call rather than
+        the sum of all calls. Inside `DustClient.request_scope()`, the
+        lookups share the caller's scope like `get`.
+
+        Args:
+            s_ids: Agent configuration stable IDs.
+            variant: "light" (default) or "full", as for `get`.
+            max_workers: Maximum number of requests in flight at once.
+
+        Returns:
+            List[AgentConfiguration], in the same order as `s_ids`.
+        """
+        if not s_ids:
+            return []
+
+        workers = min(max_workers, len(s_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return map_in_scope(
+                pool, lambda s_id: self.get(s_id, variant=variant), s_ids
+            )
+
+    @staticmethod
+    def _variant_params(variant: Optional[str]) -> Optional[Dict[str, Any]]:
+        return {"variant": variant} if variant else None
+
+    @staticmethod
+    def _parse_agent(raw: bytes, *, action: str) -> AgentConfiguration:
         try:
-            resp = GetAgentResponse.model_validate(data)
+            resp = GetAgentResponse.model_validate_json(raw)
         except ValidationError as e:
-            raise DustError(f"Failed to parse get agent response: {e}") from e
+            raise DustError(f"Failed to parse {action} agent response: {e}") from e
 
         return resp.agentConfiguration
 
@@ -124,18 +236,16 @@ class AgentsClient:
         """
         payload = {"userFavorite": user_favorite}
 
-        data = self._client.workspace_request(
+        raw = self._client.workspace_request_bytes(
             "PATCH",
-            f"/assistant/agent_configurations/{s_id}",
+            _AGENT_CONFIGURATIONS_PREFIX + s_id,
             json=payload,
         )
-
-        try:
-            resp = GetAgentResponse.model_validate(data)
-        except ValidationError as e:
-            raise DustError(f"Failed to parse update agent response: {e}") from e
-
-        return resp.agentConfiguration
+        # The favorite flag shows up in get/list/search results alike.
+        self._cache.clear()
+        for variant in ("light", "full"):
+            invalidate(("agent", s_id, variant))
+        return self._parse_agent(raw, action="update")
 
     # ------------------------------------------------------------------
     # Search by name
@@ -154,14 +264,18 @@ class AgentsClient:
         Returns:
             List[AgentConfiguration]
         """
-        data = self._client.workspace_request(
-            "GET",
-            "/assistant/agent_configurations/search",
-            params={"q": q},
-        )
+        raw = self._fetch(_AGENT_CONFIGURATIONS_SEARCH, {"q": q})
+        return self._parse_search(raw)
+
+    async def asearch(self, q: str) -> List[AgentConfiguration]:
+        """Async counterpart of `search`."""
+        raw = await self._afetch(_AGENT_CONFIGURATIONS_SEARCH, {"q": q})
+        return self._parse_search(raw)
 
+    @staticmethod
+    def _parse_search(raw: bytes) -> List[AgentConfiguration]:
         try:
-            resp = ListAgentsResponse.model_validate(data)
+            resp = ListAgentsResponse.model_validate_json(raw)
         except ValidationError as e:
             raise DustError(f"Failed to parse search agents response: {e}") from e
 
@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional, List
+from typing import Annotated, Any, Union
 
-from pydantic import BaseModel, Field, ConfigDict, HttpUrl
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    HttpUrl,
+    RootModel,
+    Tag,
+)
 
 
 class AgentModelConfig(BaseModel):
@@ -45,7 +54,7 @@ class AgentConfiguration(BaseModel):
     id: int = Field(..., description="Internal numeric identifier.")
     sId: str = Field(..., description="Stable public string identifier (sId).")
     version: int = Field(..., description="Version number of this configuration.")
-    versionCreatedAt: Optional[datetime] = Field(
+    versionCreatedAt: datetime | None = Field(
         default=None,
         description="ISO timestamp of when this version was created.",
     )
@@ -56,15 +65,18 @@ class AgentConfiguration(BaseModel):
 
     # Human-facing info
     name: str = Field(..., description="Human-readable agent name.")
-    description: Optional[str] = Field(
+    description: str | None = Field(
         default=None,
         description="Optional description of the agent.",
     )
-    instructions: Optional[str] = Field(
+    instructions: str | None = Field(
         default=None,
         description="System / prompt instructions for the agent.",
     )
-    pictureUrl: Optional[HttpUrl] = Field(
+    # Kept as a plain string: URL validation is one of pydantic's costliest
+    # per-field validators and the SDK never dereferences it. Use
+    # `picture_url` for a validated URL.
+    pictureUrl: str | None = Field(
         default=None,
         description="Avatar / picture URL for this agent.",
     )
@@ -78,42 +90,47 @@ class AgentConfiguration(BaseModel):
         ...,
         description="Visibility scope (e.g. 'global', 'visible', ...).",
     )
-    userFavorite: Optional[bool] = Field(
+    userFavorite: bool | None = Field(
         default=None,
         description="User-specific Favorite status, if provided by the API.",
     )
-    userListStatus: Optional[str] = Field(
+    userListStatus: str | None = Field(
         default=None,
         description="User-specific list status, if provided by the API.",
     )
 
     # Model config
-    model: Optional[AgentModelConfig] = Field(
+    model: AgentModelConfig | None = Field(
         default=None,
         description="Underlying model configuration for the agent.",
     )
 
     # Behavior / actions
-    actions: List[Any] = Field(
+    actions: list[Any] = Field(
         default_factory=list,
         description="List of actions/tools attached to the agent.",
     )
-    maxStepsPerRun: Optional[int] = Field(
+    maxStepsPerRun: int | None = Field(
         default=None,
         description="Maximum number of steps per run, if configured.",
     )
-    templateId: Optional[str] = Field(
+    templateId: str | None = Field(
         default=None,
         description="Associated template identifier, if any.",
     )
 
+    @property
+    def picture_url(self) -> HttpUrl | None:
+        """`pictureUrl` validated as an HttpUrl (computed on access)."""
+        return HttpUrl(self.pictureUrl) if self.pictureUrl else None
+
 
 class ListAgentsResponse(BaseModel):
     """
     Response wrapper for list agents API.
     """
 
-    agentConfigurations: List[AgentConfiguration]
+    agentConfigurations: list[AgentConfiguration]
 
 
 class GetAgentResponse(BaseModel):
@@ -122,3 +139,51 @@ class GetAgentResponse(BaseModel):
     """
 
     agentConfiguration: AgentConfiguration
+
+
+class _AgentListWrapper(BaseModel):
+    """
+    Fallback wrapper for list responses using another key than the
+    documented `agentConfigurations`.
+    """
+
+    agentConfigurations: list[AgentConfiguration] = Field(
+        ...,
+        validation_alias=AliasChoices("agents", "agent_configurations", "data"),
+    )
+
+
+def _agent_list_shape(value: Any) -> str | None:
+    if isinstance(value, list):
+        return "bare"
+    if isinstance(value, dict):
+        if "agentConfigurations" in value:
+            return "documented"
+        return "wrapped"
+    # Unknown shape: pydantic reports it as a validation error.
+    return None
+
+
+class ListAgentsEnvelope(
+    RootModel[
+        Annotated[
+            Union[
+                Annotated[ListAgentsResponse, Tag("documented")],
+                Annotated[list[AgentConfiguration], Tag("bare")],
+                Annotated[_AgentListWrapper, Tag("wrapped")],
+            ],
+            Discriminator(_agent_list_shape),
+        ]
+    ]
+):
+    """
+    Every list-agents response shape the client accepts, validated in one pass.
+
+    Besides the documented `{"agentConfigurations": [...]}`, a bare list of
+    agents and the `agents` / `agent_configurations` / `data` wrapper keys
+    are accepted, for robustness against API drift and simple mocks.
+    """
+
+    def as_list(self) -> list[AgentConfiguration]:
+        root = self.root
+        return root if isinstance(root, list) else root.agentConfigurations
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
 import time
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing, closing
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from pydantic import ConfigDict
 
+from .._scope import request_scope
 from ..config import DustConfig
-from ..exceptions import DustError
+from .._conv_cache import ConversationCache
+from ..exceptions import DustError, DustNotFoundError
 from ..conversations.models import (
     Message,
     MessageContext,
+    MessageDraft,
     MessageMention,
     MessageMentionContext,
+    ConversationEvent,
     ConversationEventType,
 )
 from .models import ChatMessage, ChatResponse
@@ -20,22 +41,104 @@ if TYPE_CHECKING:
     from ..agents.client import AgentsClient
 
 
+# Read-only variants of the request models, for instances shared through the
+# `_build_context` cache. They are still instances of the public models.
+
+
+class _SharedMessageContext(MessageContext):
+    model_config = ConfigDict(frozen=True)
+
+
+class _SharedMentionContext(MessageMentionContext):
+    model_config = ConfigDict(frozen=True)
+
+
+class _SharedMention(MessageMention):
+    model_config = ConfigDict(frozen=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_context(
+    *,
+    agent: str,
+    username: str,
+    timezone: Optional[str],
+) -> Tuple[MessageContext, Tuple[MessageMention, ...]]:
+    """
+    Build the message context and the single agent mention for a user turn.
+
+    Validated once and cached per (agent, username, timezone): every send
+    with the same identity shares the returned objects, so they are frozen
+    and the mentions come as a tuple.
+    """
+    msg_context = _SharedMessageContext(username=username, timezone=timezone)
+    mention = _SharedMention(
+        configurationId=agent,
+        context=_SharedMentionContext(timezone=timezone),
+    )
+    return msg_context, (mention,)
+
+
+def _require_username(msg_context: MessageContext) -> None:
+    if not msg_context.username:
+        # Being strict here is better UX than letting the server 400 it.
+        raise DustError(
+            "ChatClient.send requires `username`. "
+            "Your workspace expects MessageContext.username to be set."
+        )
+
+
 class ChatSession:
     """
     Stateful chat session bound to a given conversation, agent, and user identity.
 
     Use ChatClient.session(...) to create instances of this.
+
+    When no conversation_id is given, the conversation is created lazily by the
+    first `send()`, together with that first message, in a single request.
+
+    With `reuse=True`, the conversation is remembered in
+    `DustConfig.conversation_cache_path` and resumed by later sessions for the
+    same agent and title (see `ChatClient.session`).
     """
 
+    # Applications may hold many sessions at once (one per end user).
+    __slots__ = (
+        "_chat_client",
+        "_conversation_id",
+        "_agent",
+        "_username",
+        "_timezone",
+        "_title",
+        "_reuse",
+        "_resumed",
+        "_msg_context",
+        "_mentions",
+        "_send_lock",
+        "_alock",
+        "_alock_loop",
+        "_batch_lock",
+        "_pending",
+        "_pending_future",
+        "_flush_timer",
+        "_batch_worker",
+        "_apending",
+        "_apending_future",
+        "_aflush_task",
+        "_abatch_tasks",
+    )
+
     def __init__(
         self,
         *,
         chat_client: ChatClient,
-        conversation_id: str,
+        conversation_id: Optional[str],
         agent: str,
         username: str,
         timezone: Optional[str] = None,
         title: Optional[str] = None,
+        reuse: bool = False,
+        resumed: bool = False,
     ) -> None:
         self._chat_client = chat_client
         self._conversation_id = conversation_id
@@ -43,10 +146,44 @@ class ChatSession:
         self._username = username
         self._timezone = timezone
         self._title = title
+        self._reuse = reuse
+        # True while `conversation_id` comes from the conversation cache and
+        # hasn't been confirmed by a successful send yet.
+        self._resumed = resumed
+
+        # agent/username/timezone are fixed for the session's lifetime, so
+        # the message context and mentions are built once, not per send().
+        self._msg_context, self._mentions = _build_context(
+            agent=agent, username=username, timezone=timezone
+        )
+
+        # Serializes sync sends, which read and update the conversation id.
+        self._send_lock = threading.Lock()
+        # Same for async sends; asyncio locks are bound to one event loop,
+        # so this one is created on first use in each loop (see `_asend_lock`).
+        self._alock: Optional[asyncio.Lock] = None
+        self._alock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # send_batched() state: texts waiting for the next batch, the future
+        # their callers hold, the timer that sends them after max_wait, and
+        # the single worker thread that sends batches in order.
+        self._batch_lock = threading.Lock()
+        self._pending: List[str] = []
+        self._pending_future: Optional[Future[ChatResponse]] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_worker: Optional[ThreadPoolExecutor] = None
+
+        # asend_batched() state, used from a single event loop.
+        self._apending: List[str] = []
+        self._apending_future: Optional[asyncio.Future[ChatResponse]] = None
+        self._aflush_task: Optional[asyncio.Task[None]] = None
+        # Strong references to in-flight batch sends (the loop only keeps
+        # weak ones), dropped as each send completes.
+        self._abatch_tasks: Set[asyncio.Task[None]] = set()
 
     # Read-only properties for introspection
     @property
-    def conversation_id(self) -> str:
+    def conversation_id(self) -> Optional[str]:
         return self._conversation_id
 
     @property
@@ -65,20 +202,258 @@ class ChatSession:
     def title(self) -> Optional[str]:
         return self._title
 
+    def warmup(self) -> ChatSession:
+        """
+        Create the session's conversation now, if it has none yet.
+
+        The first `send()` then only posts its message. Lazy creation already
+        sends the conversation and the first message in one request, so this
+        only helps when there is idle time before the first message (e.g.
+        while the user is typing):
+
+            session = client.chat.session(agent="dust", username="leo").warmup()
+        """
+        if self._conversation_id is None:
+            conv = self._chat_client._conversations.create(title=self._title)
+            self._conversation_id = conv.sId
+            if self._reuse:
+                self._chat_client._remember_conversation(
+                    self._agent, self._title, conv.sId
+                )
+        return self
+
     def send(self, text: str) -> ChatResponse:
         """
         Send a message within this session's conversation using the bound agent.
 
         This is blocking: it waits for the assistant reply using the events stream.
+        Sends from several threads (including batches from `send_batched`)
+        are serialized: each waits for the previous one's reply.
+        """
+        with self._send_lock:
+            try:
+                resp = self._send(text)
+            except DustNotFoundError:
+                if not self._resumed:
+                    raise
+                # The remembered conversation is gone: start a fresh one.
+                self._chat_client._forget_conversation(self._agent, self._title)
+                self._conversation_id = None
+                self._resumed = False
+                resp = self._send(text)
+
+            self._resumed = False
+            return resp
+
+    async def asend(self, text: str) -> ChatResponse:
+        """
+        Async counterpart of `send`, run on the `DustClient.aio` client.
+
+        Concurrent calls are serialized like `send`: the first one creates a
+        lazy session's conversation and later ones post to it.
         """
-        return self._chat_client._send_internal(
-            agent=self._agent,
+        async with self._asend_lock():
+            try:
+                resp = await self._asend(text)
+            except DustNotFoundError:
+                if not self._resumed:
+                    raise
+                self._chat_client._forget_conversation(self._agent, self._title)
+                self._conversation_id = None
+                self._resumed = False
+                resp = await self._asend(text)
+
+            self._resumed = False
+            return resp
+
+    def _asend_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._alock is None or self._alock_loop is not loop:
+            self._alock = asyncio.Lock()
+            self._alock_loop = loop
+        return self._alock
+
+    def _send(self, text: str) -> ChatResponse:
+        created = self._conversation_id is None
+        resp = self._chat_client._send_prebuilt(
+            text=text,
+            msg_context=self._msg_context,
+            mentions=self._mentions,
+            conversation_id=self._conversation_id,
+            title=self._title,
+            timeout=self._chat_client._config.timeout,
+        )
+        self._sent(resp, created)
+        return resp
+
+    async def _asend(self, text: str) -> ChatResponse:
+        created = self._conversation_id is None
+        resp = await self._chat_client._asend_prebuilt(
             text=text,
-            username=self._username,
-            timezone=self._timezone,
+            msg_context=self._msg_context,
+            mentions=self._mentions,
             conversation_id=self._conversation_id,
             title=self._title,
+            timeout=self._chat_client._config.timeout,
         )
+        self._sent(resp, created)
+        return resp
+
+    def _sent(self, resp: ChatResponse, created: bool) -> None:
+        # First send of a lazy session: remember the conversation it created.
+        self._conversation_id = resp.conversation_id
+        if created and self._reuse:
+            self._chat_client._remember_conversation(
+                self._agent, self._title, resp.conversation_id
+            )
+
+    # ------------------------------------------------------------------
+    # Batched sends
+    # ------------------------------------------------------------------
+
+    def send_batched(
+        self,
+        text: str,
+        *,
+        max_wait: float = 0.2,
+        max_batch: int = 8,
+    ) -> Future[ChatResponse]:
+        """
+        Queue `text` and send it together with other texts queued within
+        `max_wait` seconds, as one newline-joined message.
+
+        A batch is sent when it reaches `max_batch` texts, when `max_wait`
+        has elapsed since its first text, or on `flush()`. Batches are sent
+        in order on a background thread, so this never blocks on the network
+        and never raises: every text of a batch gets the same future, which
+        is resolved with the batch's response or its error. Cancelling the
+        future before the batch is sent drops the batch.
+        """
+        with self._batch_lock:
+            self._pending.append(text)
+            if self._pending_future is None:
+                self._pending_future = Future()
+            future = self._pending_future
+            if len(self._pending) >= max_batch:
+                self._submit_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(max_wait, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return future
+
+    def flush(self) -> Optional[ChatResponse]:
+        """
+        Send the texts queued by `send_batched` now, and wait until every
+        batch queued so far has been sent.
+
+        Returns the response, or None if nothing was queued. Raises the
+        batch's error, if any.
+        """
+        with self._batch_lock:
+            if self._pending_future is None and self._batch_worker is None:
+                return None
+            sent = self._submit_pending()
+        return sent.result()
+
+    def _submit_pending(self) -> Future[Optional[ChatResponse]]:
+        # Called with _batch_lock held. With nothing pending, the submitted
+        # work is a no-op that completes once earlier batches are sent.
+        texts, future = self._pending, self._pending_future
+        self._pending, self._pending_future = [], None
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._batch_worker is None:
+            self._batch_worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dust-chat-batch"
+            )
+        return self._batch_worker.submit(self._send_batch, texts, future)
+
+    def _send_batch(
+        self, texts: List[str], future: Optional[Future[ChatResponse]]
+    ) -> Optional[ChatResponse]:
+        if future is None or not future.set_running_or_notify_cancel():
+            return None
+        try:
+            resp = self.send("\n".join(texts))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        future.set_result(resp)
+        return resp
+
+    def _flush_on_timer(self) -> None:
+        with self._batch_lock:
+            # A timer cancelled too late must not send the next batch early.
+            if self._flush_timer is threading.current_thread():
+                self._submit_pending()
+
+    async def asend_batched(
+        self,
+        text: str,
+        *,
+        max_wait: float = 0.2,
+        max_batch: int = 8,
+    ) -> ChatResponse:
+        """
+        Async counterpart of `send_batched`: waits for the batch `text` ends
+        up in and returns its response.
+
+        Batches are sent in order in their own tasks, so cancelling a caller
+        only stops that caller from waiting; the batch is still sent.
+        """
+        self._apending.append(text)
+        if self._apending_future is None:
+            self._apending_future = asyncio.get_running_loop().create_future()
+            self._aflush_task = asyncio.create_task(self._aflush_after(max_wait))
+        future = self._apending_future
+
+        if len(self._apending) >= max_batch:
+            self._asubmit_pending()
+        return await asyncio.shield(future)
+
+    async def aflush(self) -> Optional[ChatResponse]:
+        """Async counterpart of `flush`."""
+        future = self._asubmit_pending()
+        if future is None:
+            if self._abatch_tasks:
+                await asyncio.wait(set(self._abatch_tasks))
+            return None
+        return await asyncio.shield(future)
+
+    def _asubmit_pending(self) -> Optional[asyncio.Future[ChatResponse]]:
+        texts, future = self._apending, self._apending_future
+        self._apending, self._apending_future = [], None
+        timer, self._aflush_task = self._aflush_task, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        if future is None:
+            return None
+
+        # Batch sends go through `asend`, whose lock keeps them in order.
+        task = asyncio.create_task(self._asend_batch(texts, future))
+        self._abatch_tasks.add(task)
+        task.add_done_callback(self._abatch_tasks.discard)
+        return future
+
+    async def _asend_batch(
+        self, texts: List[str], future: asyncio.Future[ChatResponse]
+    ) -> None:
+        try:
+            resp = await self.asend("\n".join(texts))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            # Delivered to the batch's callers, who re-raise it.
+            future.set_exception(exc)
+        else:
+            future.set_result(resp)
+
+    async def _aflush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._asubmit_pending()
 
 
 class ChatClient:
@@ -106,6 +481,11 @@ class ChatClient:
         self._conversations = conversations
         self._agents = agents
         self._config = config
+        self._conversation_cache = (
+            ConversationCache(config.conversation_cache_path)
+            if config.conversation_cache_path is not None
+            else None
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -156,6 +536,90 @@ class ChatClient:
             timeout=timeout or self._config.timeout,
         )
 
+    async def asend(
+        self,
+        *,
+        agent: str,
+        text: str,
+        username: str,
+        timezone: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        title: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> ChatResponse:
+        """
+        Async counterpart of `send`.
+
+        Runs on the `DustClient.aio` client, so many chat calls can wait for
+        their replies concurrently on one event loop:
+
+            responses = await asyncio.gather(
+                client.chat.asend(agent="dust", text="Hi", username="leo"),
+                client.chat.asend(agent="helper", text="Hello", username="leo"),
+            )
+        """
+        msg_context, mentions = _build_context(
+            agent=agent, username=username, timezone=timezone
+        )
+        return await self._asend_prebuilt(
+            text=text,
+            msg_context=msg_context,
+            mentions=mentions,
+            conversation_id=conversation_id,
+            title=title,
+            timeout=timeout or self._config.timeout,
+        )
+
+    def create_messages(
+        self,
+        *,
+        agent: str,
+        texts: Sequence[str],
+        username: str,
+        conversation_id: str,
+        timezone: Optional[str] = None,
+        max_concurrency: int = 1,
+    ) -> List[ChatMessage]:
+        """
+        Post several user messages for `agent` into an existing conversation.
+
+        Unlike `send`, this does not wait for the assistant replies; it is
+        meant for bootstrapping a conversation (e.g. injecting history).
+        See ConversationsClient.create_messages for `max_concurrency`.
+
+        Returns:
+            The created user messages, in the same order as `texts`.
+        """
+        if not username:
+            raise DustError(
+                "ChatClient.create_messages requires `username`. "
+                "Your workspace expects MessageContext.username to be set."
+            )
+
+        msg_context, mentions = _build_context(
+            agent=agent, username=username, timezone=timezone
+        )
+
+        drafts = [
+            MessageDraft(content=text, mentions=mentions, context=msg_context)
+            for text in texts
+        ]
+        messages = self._conversations.create_messages(
+            conversation_id,
+            drafts,
+            max_concurrency=max_concurrency,
+        )
+
+        return [
+            ChatMessage.model_construct(
+                role="user",
+                text=text,
+                message_id=msg.sId,
+                conversation_id=conversation_id,
+            )
+            for text, msg in zip(texts, messages)
+        ]
+
     def session(
         self,
         *,
@@ -164,11 +628,20 @@ class ChatClient:
         timezone: Optional[str] = None,
         title: Optional[str] = None,
         conversation_id: Optional[str] = None,
+        reuse: bool = False,
     ) -> ChatSession:
         """
         Create a stateful chat session bound to one agent and a conversation.
 
-        If `conversation_id` is not provided, a new conversation is created.
+        If `conversation_id` is not provided, no request is made here: the
+        conversation is created together with the first message on the first
+        `session.send(...)`, saving a round trip.
+
+        With `reuse=True` (requires `DustConfig.conversation_cache_path`), the
+        conversation last used for this agent and title is resumed, even from
+        a previous process; a newly created one is remembered. If the
+        remembered conversation no longer exists, the first `send()` starts a
+        new one.
 
         Example:
             session = client.chat.session(
@@ -178,25 +651,51 @@ class ChatClient:
             )
             resp = session.send("Hello!")
         """
-        # Ensure we have a conversation
-        conv_id = conversation_id
-        if conv_id is None:
-            conv = self._conversations.create(title=title)
-            conv_id = conv.sId
+        resumed = False
+        if reuse:
+            if self._conversation_cache is None:
+                raise DustError(
+                    "ChatClient.session(reuse=True) requires "
+                    "`DustConfig.conversation_cache_path` to be set."
+                )
+            if conversation_id is None:
+                conversation_id = self._conversation_cache.get(
+                    self._config.workspace_id, agent, title
+                )
+                resumed = conversation_id is not None
 
         return ChatSession(
             chat_client=self,
-            conversation_id=conv_id,
+            conversation_id=conversation_id,
             agent=agent,
             username=username,
             timezone=timezone,
             title=title,
+            reuse=reuse,
+            resumed=resumed,
         )
 
+    def close(self) -> None:
+        """Close the conversation cache, if one is open."""
+        if self._conversation_cache is not None:
+            self._conversation_cache.close()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _remember_conversation(
+        self, agent: str, title: Optional[str], conversation_id: str
+    ) -> None:
+        if self._conversation_cache is not None:
+            self._conversation_cache.put(
+                self._config.workspace_id, agent, title, conversation_id
+            )
+
+    def _forget_conversation(self, agent: str, title: Optional[str]) -> None:
+        if self._conversation_cache is not None:
+            self._conversation_cache.discard(self._config.workspace_id, agent, title)
+
     def _send_internal(
         self,
         *,
@@ -209,71 +708,143 @@ class ChatClient:
         timeout: float,
     ) -> ChatResponse:
         """
-        Core implementation used by both ChatClient.send and ChatSession.send.
+        One-shot path used by ChatClient.send, where agent and user identity
+        may differ per call: builds MessageContext + MessageMention, then
+        delegates to `_send_prebuilt`.
+        """
+        msg_context, mentions = _build_context(
+            agent=agent, username=username, timezone=timezone
+        )
+        return self._send_prebuilt(
+            text=text,
+            msg_context=msg_context,
+            mentions=mentions,
+            conversation_id=conversation_id,
+            title=title,
+            timeout=timeout,
+        )
+
+    def _send_prebuilt(
+        self,
+        *,
+        text: str,
+        msg_context: MessageContext,
+        mentions: Sequence[MessageMention],
+        conversation_id: Optional[str],
+        title: Optional[str],
+        timeout: float,
+    ) -> ChatResponse:
+        """
+        Core implementation shared by ChatClient.send and ChatSession.send.
 
         It:
-          - ensures we have a conversationId
-          - builds MessageContext + MessageMention
-          - calls ConversationsClient.create_message
+          - calls ConversationsClient.create_message, or
+            ConversationsClient.create_with_message when there is no
+            conversation yet (one request instead of two)
           - streams conversation events to build the assistant reply
           - wraps everything into ChatResponse
         """
-        # 1) Ensure conversation exists
-        conv_id = conversation_id
-        if conv_id is None:
-            conv = self._conversations.create(title=title)
-            conv_id = conv.sId
+        _require_username(msg_context)
 
-        if not username:
-            # Being strict here is better UX than letting the server 400 it.
-            raise DustError(
-                "ChatClient.send requires `username`. "
-                "Your workspace expects MessageContext.username to be set."
+        # Share one request scope so repeated lookups (agent, conversation)
+        # during this turn hit the network only once.
+        with request_scope():
+            # 1) Create the user message (and the conversation, if needed)
+            msg: Message
+            conv_id = conversation_id
+            if conv_id is None:
+                conv, msg = self._conversations.create_with_message(
+                    title=title,
+                    content=text,
+                    mentions=mentions,
+                    context=msg_context,
+                )
+                conv_id = conv.sId
+            else:
+                msg = self._conversations.create_message(
+                    conversation_id=conv_id,
+                    content=text,
+                    mentions=mentions,
+                    context=msg_context,
+                )
+
+            # 2) Wrap user message
+            # The text is what we just sent; only the ids come from the
+            # server. Built from known-good values: skip re-validation.
+            user_chat_msg = ChatMessage.model_construct(
+                role="user",
+                text=text,
+                message_id=msg.sId,
+                conversation_id=conv_id,
             )
 
-        # 2) Build contexts and mentions
-        msg_context = MessageContext(
-            username=username,
-            timezone=timezone,
-        )
+            # 3) Stream events to build assistant reply
+            assistant_chat_msg: Optional[ChatMessage] = None
+            if self._config.chat_aggregate:
+                assistant_chat_msg = self._wait_for_assistant_reply(
+                    conversation_id=conv_id,
+                    user_message_id=msg.sId,
+                    timeout=timeout,
+                )
 
-        mention_context = MessageMentionContext(
-            timezone=timezone,
-        )
+            return ChatResponse.model_construct(
+                conversation_id=conv_id,
+                user_message=user_chat_msg,
+                assistant_message=assistant_chat_msg,
+            )
 
-        mention = MessageMention(
-            configurationId=agent,
-            context=mention_context,
-        )
+    async def _asend_prebuilt(
+        self,
+        *,
+        text: str,
+        msg_context: MessageContext,
+        mentions: Sequence[MessageMention],
+        conversation_id: Optional[str],
+        title: Optional[str],
+        timeout: float,
+    ) -> ChatResponse:
+        """Async counterpart of `_send_prebuilt`."""
+        _require_username(msg_context)
 
-        # 3) Create the user message
-        msg: Message = self._conversations.create_message(
-            conversation_id=conv_id,
-            content=text,
-            mentions=[mention],
-            context=msg_context,
-        )
+        with request_scope():
+            msg: Message
+            conv_id = conversation_id
+            if conv_id is None:
+                conv, msg = await self._conversations.acreate_with_message(
+                    title=title,
+                    content=text,
+                    mentions=mentions,
+                    context=msg_context,
+                )
+                conv_id = conv.sId
+            else:
+                msg = await self._conversations.acreate_message(
+                    conversation_id=conv_id,
+                    content=text,
+                    mentions=mentions,
+                    context=msg_context,
+                )
 
-        # 4) Wrap user message
-        user_chat_msg = ChatMessage(
-            role="user",
-            text=msg.content or "",
-            message_id=msg.sId,
-            conversation_id=conv_id,
-        )
+            user_chat_msg = ChatMessage.model_construct(
+                role="user",
+                text=text,
+                message_id=msg.sId,
+                conversation_id=conv_id,
+            )
 
-        # 5) Stream events to build assistant reply
-        assistant_chat_msg = self._wait_for_assistant_reply(
-            conversation_id=conv_id,
-            user_message_id=msg.sId,
-            timeout=timeout,
-        )
+            assistant_chat_msg: Optional[ChatMessage] = None
+            if self._config.chat_aggregate:
+                assistant_chat_msg = await self._await_assistant_reply(
+                    conversation_id=conv_id,
+                    user_message_id=msg.sId,
+                    timeout=timeout,
+                )
 
-        return ChatResponse(
-            conversation_id=conv_id,
-            user_message=user_chat_msg,
-            assistant_message=assistant_chat_msg,
-        )
+            return ChatResponse.model_construct(
+                conversation_id=conv_id,
+                user_message=user_chat_msg,
+                assistant_message=assistant_chat_msg,
+            )
 
     # ------------------------------------------------------------------
     # Internal: streaming conversation events
@@ -290,10 +861,13 @@ class ChatClient:
         Wait for the assistant reply corresponding to `user_message_id`.
 
         Strategy:
-          - Stream conversation events via ConversationsClient.stream_events.
+          - Stream conversation events via ConversationsClient.stream_events
+            (SSE frames are decoded from bytes with orjson, see utils.loads_event).
           - First, detect the *agent* message id whose parentMessageId == user_message_id.
-          - Then wait until we see AGENT_MESSAGE_DONE or AGENT_ERROR for that agent message.
-          - Once done, re-fetch the conversation and extract the agent's text reply.
+          - Accumulate its GENERATION_TOKENS text while waiting for
+            AGENT_MESSAGE_DONE or AGENT_ERROR for that agent message.
+          - Once done, return the accumulated text; only when the stream
+            carried no text, re-fetch the conversation and extract the reply.
 
         Returns:
             ChatMessage for the assistant reply, or None if nothing
@@ -302,56 +876,30 @@ class ChatClient:
         Raises:
             ChatError on agent_error or streaming failures.
         """
-        deadline = time.time() + timeout
+        # Monotonic: immune to wall-clock jumps (NTP) during long streams.
+        now = time.monotonic
+        deadline = now() + timeout
 
-        agent_message_id: Optional[str] = None
-        done = False
+        reply = _ReplyTracker(user_message_id)
 
         try:
-            for event in self._conversations.stream_events(
-                conversation_id,
-                timeout=timeout,
-            ):
-                # Manual timeout guard (stream itself also has a timeout).
-                if time.time() > deadline:
-                    break
-
-                etype = event.type
-                # In case anything funky happens, normalise to string.
-                if isinstance(etype, ConversationEventType):
-                    etype_value = etype.value
-                else:
-                    etype_value = str(etype or "")
-
-                # --- Step 1: find the agent message linked to this user message ---
-                if (
-                    etype_value == ConversationEventType.AGENT_MESSAGE_NEW.value
-                    and event.message is not None
-                ):
-                    parent_id = getattr(event.message, "parentMessageId", None)
-                    if parent_id == user_message_id:
-                        agent_message_id = event.message.sId
-
-                # Until we know which agent message we're following, skip.
-                if agent_message_id is None:
-                    continue
-
-                # From here on, we only care about events for this agent message.
-                if event.messageId != agent_message_id:
-                    continue
-
-                # --- Step 2: stop on done or error ---
-                if etype_value == ConversationEventType.AGENT_ERROR.value:
-                    err = getattr(event, "error", None)
-                    if isinstance(err, dict):
-                        msg = err.get("message") or repr(err)
-                    else:
-                        msg = str(err) if err is not None else "Unknown agent error"
-                    raise ChatError(f"Agent error while generating reply: {msg}")
-
-                if etype_value == ConversationEventType.AGENT_MESSAGE_DONE.value:
-                    done = True
-                    break
+            # Read on this thread: we stop at the end of the reply, and the
+            # server may keep the stream open after it. Closing an inline
+            # read releases the connection at once.
+            with closing(
+                self._conversations.stream_events(
+                    conversation_id,
+                    timeout=timeout,
+                    background=False,
+                )
+            ) as events:
+                for event in events:
+                    # Manual timeout guard (stream itself also has a timeout).
+                    if now() > deadline:
+                        break
+
+                    if reply.feed(event):
+                        break
 
         except ChatError:
             # Already a high-level chat error, just bubble up.
@@ -360,45 +908,204 @@ class ChatClient:
             # Wrap any lower-level streaming / parsing errors.
             raise ChatError(f"Error while streaming assistant reply: {exc}") from exc
 
-        # If we never even discovered an agent message, there's nothing to return.
-        if not done or agent_message_id is None:
-            # No assistant content found within timeout or no agent
-            # message linked to this user message.
+        # No assistant content found within timeout or no agent message
+        # linked to this user message.
+        if not reply.done or reply.agent_message_id is None:
             return None
 
-        # At this point, either:
-        # - done == True (we saw AGENT_MESSAGE_DONE), or
-        # - we timed out but did at least see an AGENT_MESSAGE_NEW.
-        # In both cases, we can try to read the latest conversation state.
-        conv = self._conversations.get(conversation_id)
-
-        # `conv.content` is a nested list of raw message dicts; we'll scan those.
-        assistant_text: str = ""
-        content_blocks = getattr(conv, "content", []) or []
-
-        for block in content_blocks:
-            if not isinstance(block, list):
-                continue
-            for obj in block:
-                if not isinstance(obj, dict):
-                    continue
-                if (
-                    obj.get("sId") == agent_message_id
-                    and obj.get("type") == "agent_message"
-                ):
-                    assistant_text = obj.get("content") or ""
-                    break
-            if assistant_text:
-                break
-
+        assistant_text = reply.text
         if not assistant_text:
-            # Could be a race or an agent that produced no text; in that
-            # case we just return None, same as "no reply".
+            # Nothing streamed (e.g. the workspace doesn't emit token events):
+            # read the reply from the latest conversation state.
+            conv = self._conversations.get(conversation_id)
+            assistant_text = _agent_message_text(conv, reply.agent_message_id)
+
+        return _assistant_message(
+            assistant_text, reply.agent_message_id, conversation_id
+        )
+
+    async def _await_assistant_reply(
+        self,
+        *,
+        conversation_id: str,
+        user_message_id: str,
+        timeout: float,
+    ) -> Optional[ChatMessage]:
+        """Async counterpart of `_wait_for_assistant_reply`."""
+        reply = _ReplyTracker(user_message_id)
+
+        async def follow() -> None:
+            async with aclosing(
+                self._conversations.astream_events(conversation_id, timeout=timeout)
+            ) as events:
+                async for event in events:
+                    if reply.feed(event):
+                        return
+
+        try:
+            await asyncio.wait_for(follow(), timeout)
+        except asyncio.TimeoutError:
+            # Same as the sync deadline: give up and report "no reply".
+            pass
+        except ChatError:
+            raise
+        except Exception as exc:
+            raise ChatError(f"Error while streaming assistant reply: {exc}") from exc
+
+        if not reply.done or reply.agent_message_id is None:
             return None
 
-        return ChatMessage(
-            role="assistant",
-            text=assistant_text,
-            message_id=agent_message_id,
-            conversation_id=conversation_id,
+        assistant_text = reply.text
+        if not assistant_text:
+            conv = await self._conversations.aget(conversation_id)
+            assistant_text = _agent_message_text(conv, reply.agent_message_id)
+
+        return _assistant_message(
+            assistant_text, reply.agent_message_id, conversation_id
         )
+
+
+# Event type values, looked up once rather than on every event.
+_AGENT_MESSAGE_NEW = ConversationEventType.AGENT_MESSAGE_NEW.value
+_GENERATION_TOKENS = ConversationEventType.GENERATION_TOKENS.value
+_AGENT_ERROR = ConversationEventType.AGENT_ERROR.value
+_AGENT_MESSAGE_DONE = ConversationEventType.AGENT_MESSAGE_DONE.value
+
+
+class _ReplyTracker:
+    """
+    Follows the agent reply to one user message through conversation events.
+
+    Shared by the sync and async reply waiters: they only differ in how they
+    iterate the stream.
+    """
+
+    # One tracker per chat turn.
+    __slots__ = (
+        "_user_message_id",
+        "agent_message_id",
+        "done",
+        "_token_parts",
+        "_final_text",
+        "_handlers",
+    )
+
+    def __init__(self, user_message_id: str) -> None:
+        self._user_message_id = user_message_id
+        self.agent_message_id: Optional[str] = None
+        self.done = False
+        # Reply text streamed for the followed agent message; when present it
+        # saves re-fetching the whole conversation once the agent is done.
+        self._token_parts: List[str] = []
+        self._final_text: Optional[str] = None
+        # Event type -> handler; every other event type is ignored.
+        self._handlers: Dict[str, Callable[[ConversationEvent], bool]] = {
+            _AGENT_MESSAGE_NEW: self._on_new,
+            _GENERATION_TOKENS: self._on_tokens,
+            _AGENT_ERROR: self._on_error,
+            _AGENT_MESSAGE_DONE: self._on_done,
+        }
+
+    @property
+    def text(self) -> str:
+        return self._final_text or "".join(self._token_parts)
+
+    def feed(self, event: ConversationEvent) -> bool:
+        """
+        Process one event; returns True once the reply is complete.
+
+        Raises:
+            ChatError if the agent reports an error.
+        """
+        # Normalise to a plain string (event types are str enums).
+        handler = self._handlers.get(getattr(event.type, "value", event.type))
+        if handler is None:
+            return False
+        return handler(event)
+
+    def _follows(self, event: ConversationEvent) -> bool:
+        # Until we know which agent message we're following, skip; from
+        # then on, only events for that agent message matter.
+        return (
+            self.agent_message_id is not None
+            and event.messageId == self.agent_message_id
+        )
+
+    # --- Step 1: find the agent message linked to this user message ---
+    def _on_new(self, event: ConversationEvent) -> bool:
+        if event.message is not None:
+            parent_id = getattr(event.message, "parentMessageId", None)
+            if parent_id == self._user_message_id:
+                self.agent_message_id = event.message.sId
+        return False
+
+    # --- Step 2: accumulate the reply text ---
+    def _on_tokens(self, event: ConversationEvent) -> bool:
+        if self._follows(event):
+            text = getattr(event, "text", None)
+            # Skip chain-of-thought and other non-answer tokens.
+            classification = getattr(event, "classification", "tokens")
+            if isinstance(text, str) and classification == "tokens":
+                self._token_parts.append(text)
+        return False
+
+    # --- Step 3: stop on done or error ---
+    def _on_error(self, event: ConversationEvent) -> bool:
+        if not self._follows(event):
+            return False
+        err = getattr(event, "error", None)
+        if isinstance(err, dict):
+            msg = err.get("message") or repr(err)
+        else:
+            msg = str(err) if err is not None else "Unknown agent error"
+        raise ChatError(f"Agent error while generating reply: {msg}")
+
+    def _on_done(self, event: ConversationEvent) -> bool:
+        if not self._follows(event):
+            return False
+        if event.message is not None and event.message.content:
+            self._final_text = event.message.content
+        self.done = True
+        return True
+
+
+def _agent_message_text(conv: Any, agent_message_id: str) -> str:
+    """Text of the agent message `agent_message_id` in a fetched conversation."""
+    # `conv.content` is a nested list of raw message dicts, one list per
+    # turn. The reply is almost always in the latest turn, so scan from
+    # the end and stop at the first match.
+    content_blocks = getattr(conv, "content", []) or []
+
+    target: Optional[dict] = None
+    for block in reversed(content_blocks):
+        if not isinstance(block, list):
+            continue
+        for obj in block:
+            if (
+                isinstance(obj, dict)
+                and obj.get("sId") == agent_message_id
+                and obj.get("type") == "agent_message"
+            ):
+                target = obj
+                break
+        if target is not None:
+            break
+
+    return (target or {}).get("content") or ""
+
+
+def _assistant_message(
+    text: str, agent_message_id: str, conversation_id: str
+) -> Optional[ChatMessage]:
+    if not text:
+        # Could be a race or an agent that produced no text; in that
+        # case we just return None, same as "no reply".
+        return None
+
+    # Built from fields we already extracted: skip re-validation.
+    return ChatMessage.model_construct(
+        role="assistant",
+        text=text,
+        message_id=agent_message_id,
+        conversation_id=conversation_id,
+    )
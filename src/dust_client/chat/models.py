@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from typing import Literal
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -13,9 +13,11 @@ class ChatMessage(BaseModel):
 
     This wraps the lower-level Conversations `Message` model and simplifies it
     to a role + text abstraction while still exposing IDs for debugging.
+
+    Instances are immutable snapshots of what was sent or received.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     role: Literal["user", "assistant"] = Field(
         ..., description="Role of the message author in the chat."
@@ -36,8 +38,7 @@ class ChatResponse(BaseModel):
     from conversation events (it may be None on timeouts or certain errors).
     """
 
-    ...
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     conversation_id: str = Field(
         ..., description="Conversation sId used for this interaction."
@@ -45,10 +46,11 @@ class ChatResponse(BaseModel):
     user_message: ChatMessage = Field(
         ..., description="The user message that was just sent."
     )
-    assistant_message: Optional[ChatMessage] = Field(
+    assistant_message: ChatMessage | None = Field(
         default=None,
         description=(
-            "The assistant's reply, if available. Currently None until we hook "
-            "into conversation events / agent messages."
+            "The agent's reply, aggregated from the conversation event "
+            "stream. None if no reply completed before the timeout, or when "
+            "DustConfig.chat_aggregate is disabled."
         ),
     )
@@ -2,21 +2,67 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import functools
+import importlib.util
+import logging
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, Mapping, Optional
 
 import httpx
+import orjson
 
+from . import _scope
 from .config import DustConfig
-from .agents.client import AgentsClient
-from .conversations.client import ConversationsClient
-from .chat.client import ChatClient
 from .exceptions import (
     DustError,
     map_status_to_error,
 )
 
+if TYPE_CHECKING:
+    from .agents.client import AgentsClient
+    from .conversations.client import ConversationsClient
+    from .chat.client import ChatClient
+
 __all__ = ["DustClient"]
 
+logger = logging.getLogger(__name__)
+
+# Shared connection pool settings: one long-lived pool per DustClient so that
+# TCP/TLS handshakes are amortised across every call of a session.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=40,
+    keepalive_expiry=30.0,
+)
+
+# HTTP/2 lets an open event stream and other calls (e.g. cancel_messages
+# mid-stream) share one connection. httpx needs `h2` for it (installed via
+# the `httpx[http2]` extra); fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _json_body(json: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    httpx keyword arguments sending `json` as the request body, serialized
+    with orjson rather than httpx's stdlib encoder.
+    """
+    if json is None:
+        return {}
+    return {
+        "content": orjson.dumps(json),
+        "headers": {"Content-Type": "application/json"},
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _build_user_agent(suffix: Optional[str]) -> str:
+    base = "dust-sdk-py/0.1.0"
+    if suffix:
+        return f"{base} {suffix}"
+    return base
+
 
 class DustClient:
     """
@@ -31,7 +77,13 @@ class DustClient:
         )
         client = DustClient(config)
 
-        agents = client.list_agents()
+        agents = client.agents.list()
+
+    The client owns a pooled HTTP/2 connection; use it as a context manager
+    (or call `close()`) to release it:
+
+        with DustClient(config) as client:
+            ...
     """
 
     def __init__(
@@ -39,43 +91,50 @@ class DustClient:
         config: DustConfig,
         *,
         client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
         user_agent_suffix: Optional[str] = None,
         validate_on_init: bool = False,
     ) -> None:
         self._config = config
+        # Fixed for the client's lifetime; prepended to every workspace path.
+        self._workspace_prefix = f"/api/v1/w/{config.workspace_id}"
 
         token = config.api_key or config.access_token
         assert token, "DustConfig should guarantee that a token is present."
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": self._build_user_agent(user_agent_suffix),
-        }
+        # Headers sent on every request, shared by the sync and async
+        # clients. Built per instance (never cached globally) so the token
+        # lives no longer than the client.
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": _build_user_agent(user_agent_suffix),
+            }
+        )
 
         self._client = client or httpx.Client(
             base_url=str(config.base_url),
             timeout=config.timeout,
-            headers=headers,
+            headers=self._headers,
+            http2=HTTP2_AVAILABLE,
+            limits=DEFAULT_LIMITS,
         )
+        # Built lazily on first async call, see `aio`.
+        self._aclient = async_client
 
-        # Set sub clients
-        self.agents = AgentsClient(
-            client=self,
-        )
-        self.conversations = ConversationsClient(
-            client=self,
-        )
-        self.chat = ChatClient(
-            conversations=self.conversations,
-            agents=self.agents,
-            config=self._config,
-        )
+        # Sub clients, built (and their modules imported) on first access.
+        self._agents: Optional[AgentsClient] = None
+        self._conversations: Optional[ConversationsClient] = None
+        self._chat: Optional[ChatClient] = None
 
         if validate_on_init:
             # Raises DustError / DustAPIError if invalid
             self.validate()
+        elif config.prewarm:
+            # validate() already leaves a warm connection in the pool.
+            self._start_prewarm()
 
     @property
     def config(self) -> DustConfig:
@@ -86,15 +145,99 @@ class DustClient:
         """Expose the underlying httpx client (read-only) for advanced use."""
         return self._client
 
+    @property
+    def aio(self) -> httpx.AsyncClient:
+        """
+        Underlying httpx.AsyncClient used by the `a*` coroutine methods.
+
+        Created on first access with the same base URL, headers and pool
+        limits as the synchronous client. Its connections belong to the event
+        loop that opened them, so close it from async code with `aclose()` or
+        `async with DustClient(...)`; `close()` leaves it open.
+        """
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=str(self._config.base_url),
+                timeout=self._config.timeout,
+                headers=self._headers,
+                http2=HTTP2_AVAILABLE,
+                limits=DEFAULT_LIMITS,
+            )
+        return self._aclient
+
+    @property
+    def agents(self) -> AgentsClient:
+        if self._agents is None:
+            from .agents.client import AgentsClient
+
+            self._agents = AgentsClient(client=self)
+        return self._agents
+
+    @property
+    def conversations(self) -> ConversationsClient:
+        if self._conversations is None:
+            from .conversations.client import ConversationsClient
+
+            self._conversations = ConversationsClient(client=self)
+        return self._conversations
+
+    @property
+    def chat(self) -> ChatClient:
+        if self._chat is None:
+            from .chat.client import ChatClient
+
+            self._chat = ChatClient(
+                conversations=self.conversations,
+                agents=self.agents,
+                config=self._config,
+            )
+        return self._chat
+
     def close(self) -> None:
-        """Close the underlying HTTP connection pool."""
+        """
+        Close the synchronous HTTP connection pool.
+
+        The asynchronous pool behind `aio` can only be closed on an event
+        loop: code that used the `a*` methods must call `aclose()` (or use
+        `async with`) instead, which closes both pools.
+        """
         self._client.close()
+        if self._chat is not None:
+            self._chat.close()
+
+    async def aclose(self) -> None:
+        """Close both the synchronous and the asynchronous connection pools."""
+        self._client.close()
+        if self._chat is not None:
+            self._chat.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+
+    @contextmanager
+    def request_scope(self) -> Iterator[Dict[Hashable, Any]]:
+        """
+        Deduplicate repeated `agents.get` / `conversations.get` lookups made
+        inside the `with` block (including across nested calls).
 
-    def _build_user_agent(self, suffix: Optional[str]) -> str:
-        base = "dust-sdk-py/0.1.0"
-        if suffix:
-            return f"{base} {suffix}"
-        return base
+        Example:
+            with client.request_scope():
+                client.agents.get("helper")
+                client.agents.get("helper")  # served from the scope
+        """
+        with _scope.request_scope() as scope:
+            yield scope
+
+    def __enter__(self) -> "DustClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "DustClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     # ------------------------------------------------------------------
     # Core request method
@@ -123,12 +266,47 @@ class DustClient:
                 method=method,
                 url=path,
                 params=params,
-                json=json,
+                **_json_body(json),
             )
         except httpx.HTTPError as exc:
             # network / connection / timeout errors
             raise DustError(f"Network error while calling Dust API: {exc}") from exc
 
+        return self._handle_response(response, parse_json=parse_json)
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        parse_json: bool = True,
+    ) -> Any:
+        """
+        Async counterpart of `request`, sent through the `aio` client.
+
+        Concurrent calls share the same connection pool (and thus its
+        `max_connections` limit).
+        """
+        try:
+            response = await self.aio.request(
+                method=method,
+                url=path,
+                params=params,
+                **_json_body(json),
+            )
+        except httpx.HTTPError as exc:
+            raise DustError(f"Network error while calling Dust API: {exc}") from exc
+
+        return self._handle_response(response, parse_json=parse_json)
+
+    def _handle_response(self, response: httpx.Response, *, parse_json: bool) -> Any:
+        """
+        Map an httpx response to the SDK's return value or exception.
+
+        Shared by `request` and `arequest`.
+        """
         status = response.status_code
 
         # ------------------------------------------------------------------
@@ -142,8 +320,8 @@ class DustClient:
                 return None
 
             try:
-                return response.json()
-            except ValueError as exc:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as exc:
                 raise DustError(
                     f"Failed to parse JSON response from Dust API: {exc}"
                 ) from exc
@@ -151,52 +329,9 @@ class DustClient:
         # ------------------------------------------------------------------
         # Error path (non-2xx)
         # ------------------------------------------------------------------
-        try:
-            payload = response.json()
-        except ValueError:
-            # Not JSON, fall back to plain text
-            ErrorClass = map_status_to_error(status)
-            raise ErrorClass(
-                status_code=status,
-                message=response.text or "Unknown error",
-                details={"raw": response.text},
-            )
-
-        code: Optional[str] = None
-        message: str = "Unknown error"
-        details: Dict[str, Any] = {}
-
-        if isinstance(payload, dict):
-            details = payload
-
-            # Common Dust error shapes:
-            # { "error": { "code": "...", "message": "...", ... } }
-            if "error" in payload and isinstance(payload["error"], dict):
-                err = payload["error"]
-                code = err.get("code") or err.get("type") or None
-                message = (
-                    err.get("message")
-                    or err.get("detail")
-                    or err.get("error")
-                    or message
-                )
-            else:
-                # Or flat: { "code": "...", "message": "...", ... }
-                code = payload.get("code") or payload.get("error")
-                message = (
-                    payload.get("message")
-                    or payload.get("detail")
-                    or payload.get("error_description")
-                    or message
-                )
-
+        # The body is parsed lazily by the exception, on first use.
         ErrorClass = map_status_to_error(status)
-        raise ErrorClass(
-            status_code=status,
-            message=message,
-            code=code,
-            details=details,
-        )
+        raise ErrorClass(status_code=status, raw_body=response.content)
 
     def workspace_request(
         self,
@@ -217,18 +352,80 @@ class DustClient:
             _workspace_request("GET", "/assistant/agent_configurations")
             -> /api/v1/w/<wId>/assistant/agent_configurations
         """
-        if not relative_path.startswith("/"):
-            relative_path = "/" + relative_path
-
-        path = f"/api/v1/w/{self._config.workspace_id}{relative_path}"
         return self.request(
             method=method,
-            path=path,
+            path=self._workspace_path(relative_path),
             params=params,
             json=json,
             parse_json=parse_json,
         )
 
+    async def aworkspace_request(
+        self,
+        method: str,
+        relative_path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        parse_json: bool = True,
+    ) -> Any:
+        """Async counterpart of `workspace_request`."""
+        return await self.arequest(
+            method=method,
+            path=self._workspace_path(relative_path),
+            params=params,
+            json=json,
+            parse_json=parse_json,
+        )
+
+    def workspace_request_bytes(
+        self,
+        method: str,
+        relative_path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Like `workspace_request`, but return the raw response body.
+
+        Sub-clients hand these bytes straight to pydantic's
+        `model_validate_json`, which parses and validates in one pass instead
+        of building an intermediate dict first. Non-2xx responses still raise.
+        """
+        response = self.workspace_request(
+            method,
+            relative_path,
+            params=params,
+            json=json,
+            parse_json=False,
+        )
+        return response.content
+
+    async def aworkspace_request_bytes(
+        self,
+        method: str,
+        relative_path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Async counterpart of `workspace_request_bytes`."""
+        response = await self.aworkspace_request(
+            method,
+            relative_path,
+            params=params,
+            json=json,
+            parse_json=False,
+        )
+        return response.content
+
+    def _workspace_path(self, relative_path: str) -> str:
+        if not relative_path.startswith("/"):
+            relative_path = "/" + relative_path
+
+        return self._workspace_prefix + relative_path
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
@@ -240,6 +437,9 @@ class DustClient:
         This performs a lightweight request to confirm that the workspace ID
         and token are accepted by the API.
 
+        The request goes through the pooled client, so the connection it
+        opens stays warm for the calls that follow.
+
         On success, returns None.
         On failure, raises DustError or DustAPIError.
         """
@@ -249,3 +449,21 @@ class DustClient:
             "/assistant/agent_configurations",
             parse_json=False,
         )
+
+    def _start_prewarm(self) -> None:
+        """Open a pooled connection on a daemon thread (see `DustConfig.prewarm`)."""
+        path = self._workspace_path("/assistant/agent_configurations")
+
+        def _warm() -> None:
+            if self._client.is_closed:
+                return
+            try:
+                # Only the handshake matters; the status code is irrelevant.
+                self._client.head(path)
+            except httpx.HTTPError as exc:
+                # Best effort: the first real call opens the connection itself
+                # and raises the error. Logged for diagnosing e.g. a wrong
+                # base URL or a TLS problem early.
+                logger.debug("Connection prewarm failed: %r", exc)
+
+        threading.Thread(target=_warm, name="dust-prewarm", daemon=True).start()
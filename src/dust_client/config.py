@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel, Field, HttpUrl, ValidationError, model_validator
@@ -8,6 +9,9 @@ from pydantic import BaseModel, Field, HttpUrl, ValidationError, model_validator
 
 DEFAULT_DUST_BASE_URL = "https://dust.tt"
 
+# Fields `DustConfig.from_env()` reads from the environment.
+_ENV_FIELDS = ("base_url", "workspace_id", "api_key", "access_token", "timeout")
+
 
 class DustConfig(BaseModel):
     """
@@ -40,6 +44,34 @@ class DustConfig(BaseModel):
         default=60.0,
         description="Default request timeout in seconds.",
     )
+    agents_cache_ttl: float = Field(
+        default=0.0,
+        description=(
+            "Seconds to cache agent list/get/search responses in-process "
+            "(0 disables the cache)."
+        ),
+    )
+    conversation_cache_path: Optional[Path] = Field(
+        default=None,
+        description=(
+            "SQLite file remembering the conversation of each (agent, title) "
+            "so `ChatClient.session(..., reuse=True)` can resume it across runs."
+        ),
+    )
+    chat_aggregate: bool = Field(
+        default=True,
+        description=(
+            "Have ChatClient wait for and return the assistant reply; when "
+            "False, send() returns as soon as the user message is created."
+        ),
+    )
+    prewarm: bool = Field(
+        default=False,
+        description=(
+            "Open a pooled connection in the background when DustClient is "
+            "created, so the first call doesn't pay the TCP/TLS handshake."
+        ),
+    )
 
     @model_validator(mode="after")
     def _ensure_auth_present(self) -> "DustConfig":
@@ -81,10 +113,14 @@ class DustConfig(BaseModel):
                 ],
             )
 
+        # Other settings (cache TTLs, paths, ...) have no env variable.
+        extra = {k: v for k, v in overrides.items() if k not in _ENV_FIELDS}
+
         return cls(
             base_url=base_url,
             workspace_id=workspace_id,
             api_key=api_key,  # validator will enforce at least one of api_key/access_token
             access_token=access_token,
             timeout=timeout,
+            **extra,
         )
@@ -2,29 +2,209 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence, TYPE_CHECKING, Iterator
+import asyncio
+from collections import deque
+from contextlib import aclosing, closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+    Iterator,
+    Tuple,
+)
 
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from .exceptions import ConversationError
 from .models import (
     Conversation,
-    ConversationResponse,
-    CreateMessagePayload,
     Message,
     MessageContext,
+    MessageDraft,
     MessageMention,
-    MessageResponse,
-    CancelMessagesPayload,
     CancelMessagesResponse,
     ConversationEvent,
     ConversationEventEnvelope,
+    ConversationEventType,
+)
+from .._scope import ascoped, invalidate, map_in_scope, scoped
+from ..utils import (
+    astream_sse_json,
+    astream_sse_raw,
+    iter_batches_in_thread,
+    iter_in_thread,
+    loads_event,
+    stream_sse_json,
+    stream_sse_raw,
 )
-from ..utils import stream_sse_json
 
 if TYPE_CHECKING:
     from ..client import DustClient
 
+# A mention, as a model or as the plain JSON dict the API expects.
+_Mention = Union[MessageMention, Mapping[str, Any]]
+
+# Serializes a whole mentions list in one pydantic-core call.
+_MENTIONS_ADAPTER = TypeAdapter(List[MessageMention])
+
+
+def _dump_mentions(mentions: Sequence[_Mention]) -> List[Dict[str, Any]]:
+    """
+    Mentions as JSON-ready dicts. Plain mappings (e.g. loaded from a config
+    file) are sent as they are, without a round trip through MessageMention.
+    """
+    if all(isinstance(m, MessageMention) for m in mentions):
+        return _MENTIONS_ADAPTER.dump_python(list(mentions), exclude_none=True)
+
+    dumped: List[Dict[str, Any]] = []
+    for mention in mentions:
+        if isinstance(mention, MessageMention):
+            dumped.append(mention.model_dump(exclude_none=True))
+            continue
+        if "configurationId" not in mention:
+            raise ConversationError(
+                f"Mention is missing 'configurationId': {dict(mention)!r}"
+            )
+        dumped.append(dict(mention))
+    return dumped
+
+
+def _message_payload(
+    content: str,
+    mentions: Sequence[_Mention],
+    context: Optional[MessageContext],
+) -> Dict[str, Any]:
+    """
+    JSON body of a new message: the same dict as
+    `CreateMessagePayload(...).model_dump(exclude_none=True)`, without
+    validating models the caller already built.
+    """
+    message: Dict[str, Any] = {
+        "content": content,
+        "mentions": _dump_mentions(mentions),
+    }
+    if context is not None:
+        message["context"] = context.model_dump(exclude_none=True)
+    return message
+
+
+def _response_object(raw: bytes, what: str) -> Dict[str, Any]:
+    """
+    Decode a JSON response body that must be an object.
+
+    Bodies are decoded with orjson and the `{"conversation": ...}` /
+    `{"message": ...}` envelopes are peeled off as plain dicts: conversations
+    carry their (large, untyped) content as extra fields, which orjson builds
+    much faster than pydantic's JSON mode.
+    """
+    try:
+        obj = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
+        raise ConversationError(f"Failed to parse {what} response: {exc}") from exc
+
+    if not isinstance(obj, dict):
+        raise ConversationError(
+            f"Failed to parse {what} response: expected a JSON object"
+        )
+    return obj
+
+
+# How many recent event ids a stream remembers to drop replayed events.
+_EVENT_DEDUP_WINDOW = 256
+
+
+class EventCursor:
+    """
+    Position in a conversation's event stream, kept across reconnects.
+
+    Pass the same cursor to successive `stream_events` / `astream_events`
+    calls on one conversation. Each call resumes from `last_event_id` (sent
+    as `Last-Event-ID`), and events replayed with an `eventId` among the
+    last `maxlen` seen are dropped, whichever call saw them first.
+    """
+
+    __slots__ = ("last_event_id", "_order", "_seen")
+
+    def __init__(
+        self,
+        last_event_id: Optional[str] = None,
+        *,
+        maxlen: int = _EVENT_DEDUP_WINDOW,
+    ) -> None:
+        # `eventId` of the last event yielded, if any.
+        self.last_event_id = last_event_id
+        self._order: deque[str] = deque(maxlen=maxlen)
+        self._seen: set[str] = set()
+
+    def add(self, event_id: Optional[str]) -> bool:
+        """Record `event_id`; returns False if it was already seen (a replay)."""
+        if event_id is None:
+            return True
+        if event_id in self._seen:
+            return False
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+        self._order.append(event_id)
+        self._seen.add(event_id)
+        self.last_event_id = event_id
+        return True
+
+
+def _event_cursor(
+    cursor: Optional[EventCursor], last_event_id: Optional[str]
+) -> EventCursor:
+    """The cursor a stream reads with; an explicit `last_event_id` wins."""
+    if cursor is None:
+        return EventCursor(last_event_id)
+    if last_event_id is not None:
+        cursor.last_event_id = last_event_id
+    return cursor
+
+
+def _merge_token_events(events: List[ConversationEvent]) -> List[ConversationEvent]:
+    """
+    Merge runs of `generation_tokens` events for the same message and
+    classification into one event carrying the concatenated `text`.
+    """
+    merged: List[ConversationEvent] = []
+    run: List[ConversationEvent] = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            merged.append(run[0])
+        elif run:
+            text = "".join(getattr(e, "text", None) or "" for e in run)
+            merged.append(run[0].model_copy(update={"text": text}))
+        run.clear()
+
+    for event in events:
+        if event.type != ConversationEventType.GENERATION_TOKENS:
+            flush()
+            merged.append(event)
+            continue
+        if run and (
+            event.messageId != run[0].messageId
+            or getattr(event, "classification", None)
+            != getattr(run[0], "classification", None)
+        ):
+            flush()
+        run.append(event)
+
+    flush()
+    return merged
+
+
+def _events_headers(last_event_id: Optional[str]) -> Optional[Dict[str, str]]:
+    return {"Last-Event-ID": last_event_id} if last_event_id else None
+
 
 class ConversationsClient:
     """
@@ -77,20 +257,114 @@ class ConversationsClient:
         if extra:
             body.update(extra)
 
-        data = self._client.workspace_request(
+        raw = self._client.workspace_request_bytes(
             "POST",
             "/assistant/conversations",
             json=body,
         )
 
+        data = _response_object(raw, "conversation")
         try:
-            env = ConversationResponse.model_validate(data)
+            return Conversation.model_validate(data.get("conversation"))
         except ValidationError as exc:
             raise ConversationError(
                 f"Failed to parse conversation response: {exc}"
             ) from exc
 
-        return env.conversation
+    def create_with_message(
+        self,
+        *,
+        content: str,
+        mentions: Sequence[_Mention],
+        context: Optional[MessageContext] = None,
+        title: Optional[str] = None,
+        blocking: bool = True,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Conversation, Message]:
+        """
+        Create a new conversation and post its first message in one request.
+
+        POST /api/v1/w/{wId}/assistant/conversations
+
+        This saves the extra round trip of `create()` followed by
+        `create_message()` when the first message is already known.
+
+        Args:
+            content: Text content of the initial message.
+            mentions: Which agent configuration(s) should handle the message.
+            context: Optional top-level message context (timezone, username, etc.).
+            title: Optional human-readable title for the conversation.
+            blocking: Whether the API should block until the message is processed.
+            extra: Optional additional fields to merge into the request body.
+
+        Returns:
+            (Conversation, Message): The created conversation and user message.
+        """
+        body = self._conversation_with_message_body(
+            content, mentions, context, title, blocking, extra
+        )
+        raw = self._client.workspace_request_bytes(
+            "POST",
+            "/assistant/conversations",
+            json=body,
+        )
+        return self._parse_conversation_with_message(raw)
+
+    async def acreate_with_message(
+        self,
+        *,
+        content: str,
+        mentions: Sequence[_Mention],
+        context: Optional[MessageContext] = None,
+        title: Optional[str] = None,
+        blocking: bool = True,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Conversation, Message]:
+        """Async counterpart of `create_with_message`."""
+        body = self._conversation_with_message_body(
+            content, mentions, context, title, blocking, extra
+        )
+        raw = await self._client.aworkspace_request_bytes(
+            "POST",
+            "/assistant/conversations",
+            json=body,
+        )
+        return self._parse_conversation_with_message(raw)
+
+    @staticmethod
+    def _conversation_with_message_body(
+        content: str,
+        mentions: Sequence[_Mention],
+        context: Optional[MessageContext],
+        title: Optional[str],
+        blocking: bool,
+        extra: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {}
+        if title is not None:
+            body["title"] = title
+        body["message"] = _message_payload(content, mentions, context)
+        body["blocking"] = blocking
+
+        if extra:
+            body.update(extra)
+        return body
+
+    @staticmethod
+    def _parse_conversation_with_message(raw: bytes) -> Tuple[Conversation, Message]:
+        data = _response_object(raw, "conversation")
+        try:
+            conversation = Conversation.model_validate(data.get("conversation"))
+            message = data.get("message")
+            if message is None:
+                raise ConversationError(
+                    "Conversation created without the initial message in the response."
+                )
+            return conversation, Message.model_validate(message)
+        except ValidationError as exc:
+            raise ConversationError(
+                f"Failed to parse conversation response: {exc}"
+            ) from exc
 
     def get(self, conversation_id: str) -> Conversation:
         """
@@ -103,28 +377,48 @@ class ConversationsClient:
 
         Returns:
             Conversation
+
+        Inside `DustClient.request_scope()`, repeated fetches of the same
+        conversation are served from the scope.
         """
-        data = self._client.workspace_request(
+        return scoped(
+            ("conversation", conversation_id), lambda: self._get(conversation_id)
+        )
+
+    async def aget(self, conversation_id: str) -> Conversation:
+        """Async counterpart of `get`."""
+        return await ascoped(
+            ("conversation", conversation_id), lambda: self._aget(conversation_id)
+        )
+
+    def _get(self, conversation_id: str) -> Conversation:
+        raw = self._client.workspace_request_bytes(
             "GET",
             f"/assistant/conversations/{conversation_id}",
         )
+        return self._parse_conversation(raw)
 
-        # Normal case: { "conversation": { ... } }
-        if isinstance(data, dict) and "conversation" in data:
-            try:
-                env = ConversationResponse.model_validate(data)
-                return env.conversation
-            except ValidationError as exc:
-                raise ConversationError(
-                    f"Failed to parse conversation response: {exc}"
-                ) from exc
+    async def _aget(self, conversation_id: str) -> Conversation:
+        raw = await self._client.aworkspace_request_bytes(
+            "GET",
+            f"/assistant/conversations/{conversation_id}",
+        )
+        return self._parse_conversation(raw)
 
-        # Fallback: bare conversation object
+    @staticmethod
+    def _parse_conversation(raw: bytes) -> Conversation:
+        data = _response_object(raw, "conversation")
+
+        # Normal case: { "conversation": { ... } }; otherwise a bare
+        # conversation object.
+        inner = data.get("conversation")
         try:
-            return Conversation.model_validate(data)
+            return Conversation.model_validate(
+                inner if isinstance(inner, dict) else data
+            )
         except ValidationError as exc:
             raise ConversationError(
-                f"Failed to parse conversation object: {exc}"
+                f"Failed to parse conversation response: {exc}"
             ) from exc
 
     # ------------------------------------------------------------------
@@ -136,7 +430,7 @@ class ConversationsClient:
         conversation_id: str,
         *,
         content: str,
-        mentions: Sequence[MessageMention],
+        mentions: Sequence[_Mention],
         context: Optional[MessageContext] = None,
         extra: Optional[Dict[str, Any]] = None,
     ) -> Message:
@@ -148,44 +442,144 @@ class ConversationsClient:
         Args:
             conversation_id: Conversation sId.
             content: Text content of the message (user query, etc.).
-            mentions: Which agent configuration(s) should handle this message.
+            mentions: Which agent configuration(s) should handle this message,
+                as MessageMention models or plain dicts in the API's shape.
             context: Optional top-level context (timezone, username, etc.).
             extra: Optional additional fields to merge into the request body.
 
         Returns:
             Message: The created message (user message).
         """
-        payload = CreateMessagePayload(
-            content=content,
-            mentions=list(mentions),
-            context=context,
+        body = self._message_body(content, mentions, context, extra)
+
+        raw = self._client.workspace_request_bytes(
+            "POST",
+            f"/assistant/conversations/{conversation_id}/messages",
+            json=body,
         )
+        invalidate(("conversation", conversation_id))
+        return self._parse_message(raw)
 
-        body = payload.model_dump(exclude_none=True)
-        if extra:
-            body.update(extra)
+    async def acreate_message(
+        self,
+        conversation_id: str,
+        *,
+        content: str,
+        mentions: Sequence[_Mention],
+        context: Optional[MessageContext] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Message:
+        """Async counterpart of `create_message`."""
+        body = self._message_body(content, mentions, context, extra)
 
-        data = self._client.workspace_request(
+        raw = await self._client.aworkspace_request_bytes(
             "POST",
             f"/assistant/conversations/{conversation_id}/messages",
             json=body,
         )
+        invalidate(("conversation", conversation_id))
+        return self._parse_message(raw)
+
+    def create_messages(
+        self,
+        conversation_id: str,
+        messages: Sequence[MessageDraft],
+        *,
+        max_concurrency: int = 1,
+    ) -> List[Message]:
+        """
+        Create several messages in a conversation.
+
+        The public API has no batch endpoint, so this issues one POST per
+        draft over the client's kept-alive connection pool.
+
+        Args:
+            conversation_id: Conversation sId.
+            messages: Message drafts, in the order they should be posted.
+            max_concurrency: How many POSTs may be in flight at once. The
+                default of 1 posts drafts one after another, which preserves
+                their order in the conversation. Higher values overlap the
+                requests, but Dust may then record them in any order.
+
+        Returns:
+            List[Message], in the same order as `messages`.
+        """
+        if max_concurrency <= 1 or len(messages) <= 1:
+            return [self._create_draft(conversation_id, m) for m in messages]
+
+        workers = min(max_concurrency, len(messages))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return map_in_scope(
+                pool, lambda m: self._create_draft(conversation_id, m), messages
+            )
+
+    async def acreate_messages(
+        self,
+        conversation_id: str,
+        messages: Sequence[MessageDraft],
+        *,
+        max_concurrency: int = 1,
+    ) -> List[Message]:
+        """Async counterpart of `create_messages`."""
+        if max_concurrency <= 1 or len(messages) <= 1:
+            return [await self._acreate_draft(conversation_id, m) for m in messages]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create(draft: MessageDraft) -> Message:
+            async with semaphore:
+                return await self._acreate_draft(conversation_id, draft)
+
+        return list(await asyncio.gather(*(create(m) for m in messages)))
+
+    def _create_draft(self, conversation_id: str, draft: MessageDraft) -> Message:
+        return self.create_message(
+            conversation_id,
+            content=draft.content,
+            mentions=draft.mentions,
+            context=draft.context,
+            extra=draft.extra,
+        )
 
+    async def _acreate_draft(
+        self, conversation_id: str, draft: MessageDraft
+    ) -> Message:
+        return await self.acreate_message(
+            conversation_id,
+            content=draft.content,
+            mentions=draft.mentions,
+            context=draft.context,
+            extra=draft.extra,
+        )
+
+    @staticmethod
+    def _message_body(
+        content: str,
+        mentions: Sequence[_Mention],
+        context: Optional[MessageContext],
+        extra: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        body = _message_payload(content, mentions, context)
+        if extra:
+            body.update(extra)
+        return body
+
+    @staticmethod
+    def _parse_message(raw: bytes) -> Message:
         # Typical shape: { "message": { ... } }
+        data = _response_object(raw, "message")
         try:
-            env = MessageResponse.model_validate(data)
+            return Message.model_validate(data.get("message"))
         except ValidationError as exc:
             raise ConversationError(f"Failed to parse message response: {exc}") from exc
 
-        return env.message
-
     def edit_message(
         self,
         conversation_id: str,
         message_id: str,
         *,
         content: Optional[str] = None,
-        mentions: Sequence[MessageMention],
+        mentions: Sequence[_Mention],
         extra: Optional[Dict[str, Any]] = None,
     ) -> Message:
         """
@@ -209,28 +603,26 @@ class ConversationsClient:
         body: Dict[str, Any] = {}
         if content is not None:
             body["content"] = content
-        body["mentions"] = [m.model_dump(exclude_none=True) for m in mentions]
+        body["mentions"] = _dump_mentions(mentions)
         if extra:
             body.update(extra)
 
-        data = self._client.workspace_request(
+        raw = self._client.workspace_request_bytes(
             "POST",
             f"/assistant/conversations/{conversation_id}/messages/{message_id}/edit",
             json=body,
         )
+        invalidate(("conversation", conversation_id))
 
         # Most Dust endpoints wrap messages as { "message": { ... } }
+        data = _response_object(raw, "edited message")
+        inner = data.get("message")
         try:
-            env = MessageResponse.model_validate(data)
-            return env.message
-        except ValidationError:
-            # Fallback: try to parse a bare message object
-            try:
-                return Message.model_validate(data)
-            except ValidationError as exc:
-                raise ConversationError(
-                    f"Failed to parse edited message response: {exc}"
-                ) from exc
+            return Message.model_validate(inner if isinstance(inner, dict) else data)
+        except ValidationError as exc:
+            raise ConversationError(
+                f"Failed to parse edited message response: {exc}"
+            ) from exc
 
     def cancel_messages(
         self,
@@ -243,22 +635,23 @@ class ConversationsClient:
 
         POST /api/v1/w/{wId}/assistant/conversations/{cId}/cancel
         """
-        payload = CancelMessagesPayload(messageIds=list(message_ids))
-        body = payload.model_dump(exclude_none=True)
+        # Same shape as CancelMessagesPayload, built directly.
+        body: Dict[str, Any] = {"messageIds": list(message_ids)}
         if extra:
             body.update(extra)
 
-        data = self._client.workspace_request(
+        raw = self._client.workspace_request_bytes(
             "POST",
             f"/assistant/conversations/{conversation_id}/cancel",
             json=body,
         )
+        invalidate(("conversation", conversation_id))
 
         try:
-            return CancelMessagesResponse.model_validate(data)
+            return CancelMessagesResponse.model_validate_json(raw)
         except ValidationError as exc:
             raise ConversationError(
-                f"Failed to parse cancel response: {exc}; raw={data!r}"
+                f"Failed to parse cancel response: {exc}; raw={raw!r}"
             ) from exc
 
     # ------------------------------------------------------------------
@@ -270,42 +663,202 @@ class ConversationsClient:
         conversation_id: str,
         *,
         timeout: Optional[float] = None,
+        last_event_id: Optional[str] = None,
+        batch_tokens: bool = False,
+        max_batch: int = 64,
+        background: bool = True,
+        cursor: Optional[EventCursor] = None,
     ) -> Iterator[ConversationEvent]:
         """
         Stream *conversation* events.
 
         GET /api/v1/w/{wId}/assistant/conversations/{cId}/events
 
+        Socket reads happen on a background thread (see `stream_events_raw`);
+        decoding and validation run here, in the consuming thread, so a slow
+        consumer doesn't stall the connection.
+
+        With `background=False` the socket is read on the calling thread
+        instead. Use it when you stop at a known event (e.g. the end of a
+        reply): closing the stream then releases the connection immediately,
+        even if the server keeps it open. `batch_tokens` always reads in the
+        background.
+
+        To reconnect, pass the same `cursor` (an `EventCursor`) to each call:
+        it sends the `eventId` of the last event yielded as `Last-Event-ID`,
+        so the server can skip what you already have, and drops events
+        replayed with an `eventId` it saw recently. `last_event_id` sets the
+        resume point explicitly. Without a cursor, replays are only dropped
+        within one call.
+
+        With `batch_tokens=True`, consecutive `generation_tokens` events for
+        the same message (and classification) that are already buffered are
+        merged into one event whose `text` is their concatenation, up to
+        `max_batch` at a time. Nothing is held back waiting for more tokens,
+        so this adds no latency; it only helps consumers that fall behind a
+        fast stream.
+
         Yields:
             ConversationEvent: Parsed event objects from the SSE envelope.
         """
+        cursor = _event_cursor(cursor, last_event_id)
+        if batch_tokens:
+            yield from self._stream_events_batched(
+                conversation_id,
+                timeout=timeout,
+                cursor=cursor,
+                max_batch=max_batch,
+            )
+            return
+
+        if background:
+            source = self.stream_events_raw(
+                conversation_id, timeout=timeout, last_event_id=cursor.last_event_id
+            )
+        else:
+            source = self._events_source(conversation_id, timeout, cursor.last_event_id)
+
+        with closing(source) as payloads:
+            for payload in payloads:
+                decoded = self._decode_event(payload)
+                if decoded is not None and cursor.add(decoded[0]):
+                    yield decoded[1]
+
+    def _stream_events_batched(
+        self,
+        conversation_id: str,
+        *,
+        timeout: Optional[float],
+        cursor: EventCursor,
+        max_batch: int,
+    ) -> Iterator[ConversationEvent]:
+        batches = iter_batches_in_thread(
+            self._events_source(conversation_id, timeout, cursor.last_event_id),
+            max_batch=max_batch,
+        )
+        with closing(batches):
+            for batch in batches:
+                events = []
+                for payload in batch:
+                    decoded = self._decode_event(payload)
+                    if decoded is not None and cursor.add(decoded[0]):
+                        events.append(decoded[1])
+                yield from _merge_token_events(events)
+
+    async def astream_events(
+        self,
+        conversation_id: str,
+        *,
+        timeout: Optional[float] = None,
+        last_event_id: Optional[str] = None,
+        cursor: Optional[EventCursor] = None,
+    ) -> AsyncIterator[ConversationEvent]:
+        """
+        Async counterpart of `stream_events`, read on the `aio` client.
+
+        Use `contextlib.aclosing` (or exhaust the stream) to release the
+        connection promptly when stopping early.
+        """
         effective_timeout = timeout or self._client.config.timeout
 
-        path = (
-            f"/api/v1/w/{self._client.config.workspace_id}"
+        path = self._client._workspace_path(
             f"/assistant/conversations/{conversation_id}/events"
         )
 
-        for raw in stream_sse_json(
+        cursor = _event_cursor(cursor, last_event_id)
+        async with aclosing(
+            astream_sse_raw(
+                self._client.aio,
+                method="GET",
+                path=path,
+                timeout=effective_timeout,
+                headers=_events_headers(cursor.last_event_id),
+            )
+        ) as payloads:
+            async for payload in payloads:
+                decoded = self._decode_event(payload)
+                if decoded is not None and cursor.add(decoded[0]):
+                    yield decoded[1]
+
+    @classmethod
+    def _decode_event(
+        cls, payload: bytes
+    ) -> Optional[Tuple[Optional[str], ConversationEvent]]:
+        """
+        Decode and validate one streamed event payload.
+
+        Returns (eventId, event), or None for payloads that aren't a JSON
+        object (skipped).
+        """
+        # Fast path: the usual envelope is validated straight from the bytes
+        # by pydantic-core, without building an intermediate dict.
+        try:
+            env = ConversationEventEnvelope.model_validate_json(payload)
+        except ValidationError:
+            pass
+        else:
+            return env.eventId, env.data
+
+        # Bare events, malformed payloads and real validation errors.
+        raw = loads_event(payload)
+        if raw is None:
+            return None
+        event_id = raw.get("eventId")
+        return (event_id if isinstance(event_id, str) else None), cls._parse_event(raw)
+
+    @staticmethod
+    def _parse_event(raw: Dict[str, Any]) -> ConversationEvent:
+        try:
+            # Dust sends: { "eventId": "...", "data": { ... } }
+            if "data" in raw:
+                return ConversationEventEnvelope.model_validate(raw).data
+
+            # Fallback: in case Dust ever sends bare event objects
+            return ConversationEvent.model_validate(raw)
+        except ValidationError as exc:
+            raise ConversationError(
+                f"Failed to parse conversation event: {exc}; raw={raw!r}"
+            ) from exc
+
+    def stream_events_raw(
+        self,
+        conversation_id: str,
+        *,
+        timeout: Optional[float] = None,
+        last_event_id: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream *conversation* events as undecoded JSON payloads.
+
+        Same endpoint as `stream_events`, without any parsing: each item is
+        the JSON document of one event, as bytes. The connection is read on
+        a background thread into a bounded buffer, so the caller can do its
+        own (cheaper) decoding without holding up the socket.
+
+        Closing the generator (or breaking out of the loop) closes the
+        underlying HTTP response.
+        """
+        return iter_in_thread(
+            self._events_source(conversation_id, timeout, last_event_id)
+        )
+
+    def _events_source(
+        self,
+        conversation_id: str,
+        timeout: Optional[float],
+        last_event_id: Optional[str],
+    ) -> Iterator[bytes]:
+        """Raw event payloads of a conversation, read on the calling thread."""
+        path = self._client._workspace_path(
+            f"/assistant/conversations/{conversation_id}/events"
+        )
+        return stream_sse_raw(
             http=self._client.http,
             method="GET",
             path=path,
-            timeout=effective_timeout,
-        ):
-            try:
-                # Dust sends: { "eventId": "...", "data": { ... } }
-                if isinstance(raw, dict) and "data" in raw:
-                    env = ConversationEventEnvelope.model_validate(raw)
-                    event = env.data
-                else:
-                    # Fallback: in case Dust ever sends bare event objects
-                    event = ConversationEvent.model_validate(raw)
-            except ValidationError as exc:
-                raise ConversationError(
-                    f"Failed to parse conversation event: {exc}; raw={raw!r}"
-                ) from exc
-
-            yield event
+            timeout=timeout or self._client.config.timeout,
+            headers=_events_headers(last_event_id),
+        )
 
     def stream_message_events(
         self,
@@ -331,8 +884,7 @@ class ConversationsClient:
         """
         effective_timeout = timeout or self._client.config.timeout
 
-        path = (
-            f"/api/v1/w/{self._client.config.workspace_id}"
+        path = self._client._workspace_path(
             f"/assistant/conversations/{conversation_id}/messages/{message_id}/events"
         )
 
@@ -342,3 +894,33 @@ class ConversationsClient:
             path=path,
             timeout=effective_timeout,
         )
+
+    async def astream_message_events(
+        self,
+        conversation_id: str,
+        message_id: str,
+        *,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async counterpart of `stream_message_events`, read on the `aio` client.
+
+        Use `contextlib.aclosing` (or exhaust the stream) to release the
+        connection promptly when stopping early.
+        """
+        effective_timeout = timeout or self._client.config.timeout
+
+        path = self._client._workspace_path(
+            f"/assistant/conversations/{conversation_id}/messages/{message_id}/events"
+        )
+
+        async with aclosing(
+            astream_sse_json(
+                self._client.aio,
+                method="GET",
+                path=path,
+                timeout=effective_timeout,
+            )
+        ) as events:
+            async for event in events:
+                yield event
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -26,11 +26,11 @@ class Conversation(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     sId: str = Field(..., description="Stable identifier for the conversation.")
-    title: Optional[str] = Field(
+    title: str | None = Field(
         default=None,
         description="Human-readable title of the conversation.",
     )
-    created_at: Optional[int] = Field(
+    created_at: int | None = Field(
         default=None,
         description="Creation timestamp in milliseconds since epoch.",
     )
@@ -41,13 +41,15 @@ class ConversationResponse(BaseModel):
     Envelope used by the API for conversation responses:
 
     {
-      "conversation": { ... }
+      "conversation": { ... },
+      "message": { ... }   # only when created with an initial message
     }
     """
 
     model_config = ConfigDict(extra="allow")
 
     conversation: Conversation
+    message: Message | None = None
 
 
 class ConversationEventType(str, Enum):
@@ -87,16 +89,16 @@ class ConversationEvent(BaseModel):
             "agent_message_done, generation_tokens, agent_error)."
         ),
     )
-    created: Optional[int] = Field(
+    created: int | None = Field(
         default=None,
         description="Event creation timestamp (ms since epoch).",
     )
-    messageId: Optional[str] = Field(
+    messageId: str | None = Field(
         default=None,
         description="Related message sId, if any.",
     )
     # `message` uses the existing Message model; extra fields are allowed.
-    message: Optional[Message] = None
+    message: Message | None = None
 
 
 class ConversationEventEnvelope(BaseModel):
@@ -130,7 +132,7 @@ class ConversationEventsResponse(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    events: List[ConversationEvent]
+    events: list[ConversationEvent]
 
 
 # ---------------------------------------------------------------------------
@@ -152,8 +154,8 @@ class MessageMentionContext(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    timezone: Optional[str] = None
-    modelSettings: Optional[Dict[str, Any]] = None
+    timezone: str | None = None
+    modelSettings: dict[str, Any] | None = None
 
 
 class MessageMention(BaseModel):
@@ -173,7 +175,7 @@ class MessageMention(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     configurationId: str
-    context: Optional[MessageMentionContext] = None
+    context: MessageMentionContext | None = None
 
 
 class MessageContext(BaseModel):
@@ -191,9 +193,9 @@ class MessageContext(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    timezone: Optional[str] = None
-    username: Optional[str] = None
-    queryType: Optional[str] = None
+    timezone: str | None = None
+    username: str | None = None
+    queryType: str | None = None
 
 
 class CreateMessagePayload(BaseModel):
@@ -218,8 +220,21 @@ class CreateMessagePayload(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     content: str
-    mentions: List[MessageMention]
-    context: Optional[MessageContext] = None
+    mentions: list[MessageMention]
+    context: MessageContext | None = None
+
+
+class MessageDraft(BaseModel):
+    """
+    A message to be posted with ConversationsClient.create_messages.
+
+    Mirrors the keyword arguments of ConversationsClient.create_message.
+    """
+
+    content: str
+    mentions: list[MessageMention]
+    context: MessageContext | None = None
+    extra: dict[str, Any] | None = None
 
 
 class CancelMessagesPayload(BaseModel):
@@ -232,7 +247,7 @@ class CancelMessagesPayload(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
-    messageIds: List[str]
+    messageIds: list[str]
 
 
 class CancelMessagesResponse(BaseModel):
@@ -272,11 +287,11 @@ class Message(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     sId: str
-    conversation_sId: Optional[str] = None
-    content: Optional[str] = None
-    author_name: Optional[str] = None
-    author_type: Optional[str] = None
-    created_at: Optional[int] = None
+    conversation_sId: str | None = None
+    content: str | None = None
+    author_name: str | None = None
+    author_type: str | None = None
+    created_at: int | None = None
 
 
 class MessageResponse(BaseModel):
@@ -291,3 +306,11 @@ class MessageResponse(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     message: Message
+
+
+# Models above reference `Message` before its definition; resolve them now
+# rather than on first validation.
+ConversationResponse.model_rebuild()
+ConversationEvent.model_rebuild()
+ConversationEventEnvelope.model_rebuild()
+ConversationEventsResponse.model_rebuild()
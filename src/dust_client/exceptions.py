@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
 
 
 # ---------------------------------------------------------------------------
@@ -23,29 +25,134 @@ class DustAPIError(DustError):
         code: Optional Dust-specific error code (string).
         message: Human-readable error message.
         details: Raw error details payload.
+
+    When raised by DustClient, the error body is kept as bytes and only
+    parsed the first time `code`, `message`, `details`, `args` or `str()` is
+    used, so callers that just check the type (e.g. retry on 429) never pay
+    for it. The attributes can still be assigned, and `args` is
+    `(str(error),)` as for the other SDK exceptions.
     """
 
     def __init__(
         self,
         status_code: int,
-        message: str,
+        message: Optional[str] = None,
         *,
         code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
+        raw_body: Optional[bytes] = None,
     ) -> None:
         self.status_code = status_code
-        self.code = code
-        self.message = message
-        self.details = details or {}
-        super().__init__(self.__str__())
+        self._code = code
+        self._message = message
+        self._details = details
+        self._raw_body = raw_body
+        # str() result, rendered on first use (logging may ask many times).
+        self._rendered: Optional[str] = None
+        # Set only when `args` is assigned; otherwise derived from str().
+        self._args: Optional[Tuple[Any, ...]] = None
+        super().__init__()
+
+    @property
+    def code(self) -> Optional[str]:
+        self._parse_body()
+        return self._code
+
+    @code.setter
+    def code(self, value: Optional[str]) -> None:
+        self._parse_body()
+        self._code = value
+        self._rendered = None
+
+    @property
+    def message(self) -> str:
+        self._parse_body()
+        return self._message or ""
+
+    @message.setter
+    def message(self, value: Optional[str]) -> None:
+        self._parse_body()
+        self._message = value
+        self._rendered = None
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        self._parse_body()
+        if self._details is None:
+            self._details = {}
+        return self._details
+
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._parse_body()
+        self._details = value
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        if self._args is None:
+            return (str(self),)
+        return self._args
+
+    @args.setter
+    def args(self, value: Any) -> None:
+        self._args = tuple(value)
+
+    def _parse_body(self) -> None:
+        if self._raw_body is None:
+            return
+
+        code, message, details = _parse_error_body(self._raw_body)
+        self._raw_body = None
+        # Values passed explicitly to the constructor win.
+        if self._code is None:
+            self._code = code
+        if self._message is None:
+            self._message = message
+        if self._details is None:
+            self._details = details
 
     def __str__(self) -> str:
-        base = f"Dust API error {self.status_code}"
-        if self.code:
-            base += f" [{self.code}]"
-        if self.message:
-            base += f": {self.message}"
-        return base
+        if self._rendered is None:
+            base = f"Dust API error {self.status_code}"
+            if self.code:
+                base += f" [{self.code}]"
+            if self.message:
+                base += f": {self.message}"
+            self._rendered = base
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.args))})"
+
+
+def _parse_error_body(body: bytes) -> Tuple[Optional[str], str, Dict[str, Any]]:
+    """Extract (code, message, details) from a Dust error response body."""
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        # Not JSON, fall back to plain text
+        text = body.decode("utf-8", errors="replace")
+        return None, text or "Unknown error", {"raw": text}
+
+    if not isinstance(payload, dict):
+        return None, "Unknown error", {}
+
+    # Common Dust error shapes:
+    # { "error": { "code": "...", "message": "...", ... } }
+    err = payload.get("error")
+    if isinstance(err, dict):
+        code = err.get("code") or err.get("type") or None
+        message = err.get("message") or err.get("detail") or err.get("error")
+    else:
+        # Or flat: { "code": "...", "message": "...", ... }
+        code = payload.get("code") or err
+        message = (
+            payload.get("message")
+            or payload.get("detail")
+            or payload.get("error_description")
+        )
+
+    return code, message or "Unknown error", payload
 
 
 # ---------------------------------------------------------------------------
@@ -101,10 +208,11 @@ def map_status_to_error(status_code: int) -> Type[DustAPIError]:
 
     Falls back to DustServerError for 5xx, or DustAPIError for other cases.
     """
-    if status_code in _STATUS_MAP:
-        return _STATUS_MAP[status_code]
+    error_class = _STATUS_MAP.get(status_code)
+    if error_class is not None:
+        return error_class
 
-    if 500 <= status_code <= 599:
+    if status_code // 100 == 5:
         return DustServerError
 
     return DustAPIError
@@ -2,30 +2,57 @@
 
 from __future__ import annotations
 
-import json
-from typing import Iterator, Dict, Any
+import queue
+import threading
+from contextlib import aclosing, closing
+from typing import AsyncIterator, Iterator, Dict, Any, List, Optional, TypeVar
 
 import httpx
+import orjson
 
+from ._sse import EventFramer
 from .exceptions import DustError
 
+T = TypeVar("T")
 
-def stream_sse_json(
+_STREAM_HEADERS = {
+    "Accept": "text/event-stream",
+    # Ask intermediaries not to buffer the event stream.
+    "Cache-Control": "no-cache",
+}
+
+
+def _stream_headers(extra: Optional[Dict[str, str]]) -> Dict[str, str]:
+    return {**_STREAM_HEADERS, **extra} if extra else _STREAM_HEADERS
+
+
+# Events buffered between the background reader and the consumer before the
+# reader blocks (and stops pulling from the socket).
+_READER_QUEUE_SIZE = 64
+
+
+def stream_sse_raw(
     http: httpx.Client,
     *,
     method: str,
     path: str,
     timeout: float,
     error_cls=DustError,
-) -> Iterator[Dict[str, Any]]:
+    headers: Optional[Dict[str, str]] = None,
+) -> Iterator[bytes]:
     """
-    Unified streaming parser for Dust SSE/NDJSON endpoints.
+    Stream the raw JSON payload of each event of a Dust SSE/NDJSON endpoint.
 
     This supports:
       - Server-Sent Events (lines beginning with "data: {...}")
       - NDJSON (one JSON per line)
 
-    It yields each parsed JSON object (dict).
+    Only framing is done here: blank lines and ":" keep-alive comments are
+    dropped, the "data:" prefix is stripped, and the remaining bytes are
+    yielded undecoded.
+
+    Framing is done per chunk by `_sse.EventFramer`, which cuts all complete
+    lines of a chunk in one C-level split.
 
     Args:
         http: The underlying httpx.Client
@@ -33,16 +60,17 @@ def stream_sse_json(
         path: Full path (relative to client's base_url)
         timeout: Streaming timeout
         error_cls: Exception class to raise on protocol/network errors
+        headers: Extra request headers (e.g. Last-Event-ID)
 
     Yields:
-        dict events as they arrive.
+        bytes: one JSON document per event, as it arrives.
     """
 
     try:
         with http.stream(
             method,
             path,
-            headers={"Accept": "text/event-stream"},
+            headers=_stream_headers(headers),
             timeout=timeout,
         ) as resp:
             if resp.status_code != 200:
@@ -55,38 +83,240 @@ def stream_sse_json(
                     f"Streaming error: status={resp.status_code}, body={body!r}"
                 )
 
-            buffer = ""
+            framer = EventFramer()
+            # No chunk_size: httpx would hold data back until that many bytes
+            # arrived. Each network read (up to 64 KiB) is framed as soon as
+            # it lands, so events are never delayed and bursts are framed in
+            # one pass.
+            for chunk in resp.iter_bytes():
+                yield from framer.feed(chunk)
 
-            for chunk in resp.iter_text():
-                buffer += chunk
+            # Last line may not be newline-terminated (NDJSON).
+            yield from framer.flush()
 
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
+    except Exception as exc:
+        if isinstance(exc, error_cls):
+            raise
+        raise error_cls(f"Streaming failure: {exc}") from exc
 
-                    if not line or line.startswith(":"):
-                        continue
 
-                    # SSE style: "data: {...}"
-                    if line.startswith("data:"):
-                        data_str = line[len("data:") :].strip()
-                    else:
-                        # NDJSON style — whole line is JSON
-                        data_str = line
+async def astream_sse_raw(
+    http: httpx.AsyncClient,
+    *,
+    method: str,
+    path: str,
+    timeout: float,
+    error_cls=DustError,
+    headers: Optional[Dict[str, str]] = None,
+) -> AsyncIterator[bytes]:
+    """Async counterpart of `stream_sse_raw`, for an httpx.AsyncClient."""
 
-                    if not data_str:
-                        continue
+    try:
+        async with http.stream(
+            method,
+            path,
+            headers=_stream_headers(headers),
+            timeout=timeout,
+        ) as resp:
+            if resp.status_code != 200:
+                try:
+                    body = (await resp.aread()).decode("utf-8", errors="replace")
+                except Exception:
+                    body = None
+                raise error_cls(
+                    f"Streaming error: status={resp.status_code}, body={body!r}"
+                )
 
-                    try:
-                        obj = json.loads(data_str)
-                    except json.JSONDecodeError:
-                        # malformed chunk — ignore
-                        continue
+            framer = EventFramer()
+            async for chunk in resp.aiter_bytes():
+                for data in framer.feed(chunk):
+                    yield data
 
-                    if isinstance(obj, dict):
-                        yield obj
+            for data in framer.flush():
+                yield data
 
     except Exception as exc:
         if isinstance(exc, error_cls):
             raise
         raise error_cls(f"Streaming failure: {exc}") from exc
+
+
+def stream_sse_json(
+    http: httpx.Client,
+    *,
+    method: str,
+    path: str,
+    timeout: float,
+    error_cls=DustError,
+    headers: Optional[Dict[str, str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Unified streaming parser for Dust SSE/NDJSON endpoints.
+
+    Same framing as `stream_sse_raw`, but each payload is decoded and only
+    JSON objects are yielded; malformed payloads are skipped.
+
+    Yields:
+        dict events as they arrive.
+    """
+    for data in stream_sse_raw(
+        http,
+        method=method,
+        path=path,
+        timeout=timeout,
+        error_cls=error_cls,
+        headers=headers,
+    ):
+        obj = loads_event(data)
+        if obj is not None:
+            yield obj
+
+
+async def astream_sse_json(
+    http: httpx.AsyncClient,
+    *,
+    method: str,
+    path: str,
+    timeout: float,
+    error_cls=DustError,
+    headers: Optional[Dict[str, str]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of `stream_sse_json`, for an httpx.AsyncClient."""
+    async with aclosing(
+        astream_sse_raw(
+            http,
+            method=method,
+            path=path,
+            timeout=timeout,
+            error_cls=error_cls,
+            headers=headers,
+        )
+    ) as payloads:
+        async for data in payloads:
+            obj = loads_event(data)
+            if obj is not None:
+                yield obj
+
+
+def loads_event(data: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one event payload; returns None unless it is a JSON object."""
+    try:
+        obj = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # malformed chunk (bad JSON or invalid UTF-8) — ignore
+        return None
+
+    return obj if isinstance(obj, dict) else None
+
+
+# ----------------------------------------------------------------------
+# Background reading
+# ----------------------------------------------------------------------
+
+
+class _ReaderFailed:
+    """Carries an exception raised by the reader thread to the consumer."""
+
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+_READER_DONE = object()
+
+
+def iter_in_thread(
+    source: Iterator[T],
+    *,
+    maxsize: int = _READER_QUEUE_SIZE,
+) -> Iterator[T]:
+    """
+    Drain `source` on a daemon thread and yield its items from a bounded queue.
+
+    Lets the network reads of a stream keep going while the consumer spends
+    CPU on each item (JSON decoding, model validation, user code). At most
+    `maxsize` items are buffered; beyond that the reader waits.
+
+    Exceptions raised by `source` are re-raised in the consumer. Closing the
+    returned generator (e.g. `break` in a `for` loop) returns immediately and
+    tells the reader to stop; the reader closes `source` — and with it the
+    HTTP response — on its own thread, once its pending read returns. On a
+    stream the server keeps open without sending anything, that is only at
+    the next chunk or the read timeout: consumers that stop early on a known
+    event should read on their own thread instead.
+    """
+    with closing(iter_batches_in_thread(source, maxsize=maxsize, max_batch=1)) as b:
+        for batch in b:
+            yield batch[0]
+
+
+def iter_batches_in_thread(
+    source: Iterator[T],
+    *,
+    maxsize: int = _READER_QUEUE_SIZE,
+    max_batch: int = _READER_QUEUE_SIZE,
+) -> Iterator[List[T]]:
+    """
+    Like `iter_in_thread`, but yield every item already buffered at once.
+
+    Each list holds between 1 and `max_batch` items: the consumer waits for
+    the first one, then takes whatever else the reader has queued meanwhile.
+    Batching never waits for more items, so it adds no latency.
+    """
+    items: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        if stop.is_set():
+            return False
+        items.put(item)
+        # The consumer may have stopped while we were blocked on a full queue.
+        return not stop.is_set()
+
+    def _reader() -> None:
+        outcome: Any = _READER_DONE
+        try:
+            for item in source:
+                if not _put(item):
+                    return
+        except BaseException as exc:
+            outcome = _ReaderFailed(exc)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+        _put(outcome)
+
+    thread = threading.Thread(target=_reader, name="dust-stream-reader", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            batch = [items.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(items.get_nowait())
+                except queue.Empty:
+                    break
+
+            # The reader's outcome is always the last item it queues.
+            last = batch[-1]
+            if last is _READER_DONE or isinstance(last, _ReaderFailed):
+                batch.pop()
+                if batch:
+                    yield batch
+                if isinstance(last, _ReaderFailed):
+                    raise last.exc
+                return
+            yield batch
+    finally:
+        stop.set()
+        # Free a slot so a reader blocked in `put` wakes up and sees `stop`.
+        # The reader isn't joined: it may be blocked on an idle socket, and it
+        # is a daemon that exits on its own after its next read.
+        try:
+            while True:
+                items.get_nowait()
+        except queue.Empty:
+            pass
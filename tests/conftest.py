@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
+import httpx
+import orjson
 import pytest
 
+from dust_client.client import DustClient
 from dust_client.config import DustConfig
 from dust_client.conversations.client import ConversationsClient
 from dust_client.chat.client import ChatClient
@@ -35,6 +38,7 @@ class DummyDustClient:
         method: str,
         path: str,
         json: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
     ) -> Any:
         method = method.upper()
         self.calls.append({"method": method, "path": path, "json": json})
@@ -43,6 +47,17 @@ class DummyDustClient:
             raise RuntimeError(f"No stubbed response for {method} {path}")
         return self._responses[key]
 
+    def workspace_request_bytes(
+        self,
+        method: str,
+        path: str,
+        json: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
+    ) -> bytes:
+        return orjson.dumps(
+            self.workspace_request(method, path, json=json, params=params)
+        )
+
 
 @pytest.fixture
 def dummy_config() -> DustConfig:
@@ -60,6 +75,31 @@ def dummy_dust_client(dummy_config: DustConfig) -> DummyDustClient:
     return DummyDustClient(dummy_config)
 
 
+@pytest.fixture
+def make_dust_client(
+    dummy_config: DustConfig,
+) -> Callable[[Callable[[httpx.Request], httpx.Response]], DustClient]:
+    """
+    Build a real DustClient whose sync and async transports are served by
+    `handler`, so the full request/parse stack runs without network access.
+    """
+
+    def factory(
+        handler: Callable[[httpx.Request], httpx.Response],
+        **config_overrides: Any,
+    ) -> DustClient:
+        config = dummy_config.model_copy(update=config_overrides)
+        base_url = str(config.base_url)
+        transport = httpx.MockTransport(handler)
+        return DustClient(
+            config,
+            client=httpx.Client(base_url=base_url, transport=transport),
+            async_client=httpx.AsyncClient(base_url=base_url, transport=transport),
+        )
+
+    return factory
+
+
 @pytest.fixture
 def conversations_client(dummy_dust_client: DummyDustClient) -> ConversationsClient:
     return ConversationsClient(client=dummy_dust_client)
@@ -0,0 +1,268 @@
+# tests/test_agents_client.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from dust_client.agents.models import AgentConfiguration
+from dust_client.exceptions import DustError
+
+
+def _agent_payload(s_id: str) -> dict:
+    return {
+        "id": 1,
+        "sId": s_id,
+        "version": 1,
+        "name": f"agent-{s_id}",
+        "status": "active",
+        "scope": "visible",
+    }
+
+
+def _agents_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    prefix = "/api/v1/w/w_test/assistant/agent_configurations"
+
+    if path == prefix:
+        return httpx.Response(200, json={"agentConfigurations": [_agent_payload("a1")]})
+    if path == prefix + "/search":
+        q = request.url.params["q"]
+        return httpx.Response(200, json={"agentConfigurations": [_agent_payload(q)]})
+
+    s_id = path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"agentConfiguration": _agent_payload(s_id)})
+
+
+def test_get_many_preserves_input_order(make_dust_client):
+    client = make_dust_client(_agents_handler)
+
+    agents = client.agents.get_many(["a1", "a2", "a3"], max_workers=3)
+
+    assert [a.sId for a in agents] == ["a1", "a2", "a3"]
+    assert all(isinstance(a, AgentConfiguration) for a in agents)
+
+
+def test_async_methods_can_be_gathered(make_dust_client):
+    client = make_dust_client(_agents_handler)
+
+    async def main():
+        return await asyncio.gather(
+            client.agents.alist(),
+            client.agents.aget("a2"),
+            client.agents.asearch("finder"),
+        )
+
+    listed, agent, found = asyncio.run(main())
+
+    assert [a.sId for a in listed] == ["a1"]
+    assert agent.sId == "a2"
+    assert [a.sId for a in found] == ["finder"]
+
+
+def test_concurrent_identical_gets_share_one_request(make_dust_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        # Keep the first request in flight while the other callers arrive.
+        time.sleep(0.2)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+    barrier = threading.Barrier(4)
+
+    def get():
+        barrier.wait()
+        return client.agents.get("a1")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        agents = list(pool.map(lambda _: get(), range(4)))
+
+    assert [a.sId for a in agents] == ["a1"] * 4
+    assert len(calls) == 1
+
+
+def test_concurrent_identical_agets_share_one_request(make_dust_client):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+
+    async def main():
+        return await asyncio.gather(*(client.agents.aget("a1") for _ in range(3)))
+
+    agents = asyncio.run(main())
+
+    assert [a.sId for a in agents] == ["a1"] * 3
+    assert len(calls) == 1
+
+
+def test_concurrent_async_gets_survive_the_first_caller_being_cancelled(
+    make_dust_client,
+):
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.02)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+
+    async def main():
+        first = asyncio.create_task(client.agents.aget("a1"))
+        await asyncio.sleep(0.005)
+        second = asyncio.create_task(client.agents.aget("a1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    agent = asyncio.run(main())
+
+    assert agent.sId == "a1"
+    assert len(calls) == 1
+
+
+def test_reads_are_cached_when_ttl_is_set(make_dust_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.method == "PATCH":
+            payload = dict(_agent_payload("a1"), userFavorite=True)
+            return httpx.Response(200, json={"agentConfiguration": payload})
+        return _agents_handler(request)
+
+    client = make_dust_client(handler, agents_cache_ttl=60)
+
+    client.agents.get("a1")
+    client.agents.get("a1")
+    client.agents.list()
+    client.agents.list()
+    assert len(calls) == 2
+
+    # Writes invalidate cached reads.
+    client.agents.update("a1", user_favorite=True)
+    client.agents.get("a1")
+    assert len(calls) == 4
+
+    client.agents.invalidate_cache()
+    client.agents.list()
+    assert len(calls) == 5
+
+
+def test_ttl_cache_purges_expired_entries_on_set(monkeypatch):
+    from dust_client import _cache
+
+    now = [0.0]
+    monkeypatch.setattr(_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = _cache.TTLCache(10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    now[0] = 5.0
+    cache.set("a", 3)  # refreshed, so it outlives "b"
+    now[0] = 12.0
+    cache.set("c", 4)
+
+    assert list(cache._data) == ["a", "c"]
+    assert cache.get("a") == 3
+
+
+def test_reads_are_not_cached_by_default(make_dust_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+
+    client.agents.get("a1")
+    client.agents.get("a1")
+    assert len(calls) == 2
+
+
+def test_request_scope_dedupes_agent_lookups(make_dust_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+
+    with client.request_scope():
+        first = client.agents.get("a1")
+        second = client.agents.get("a1")
+        client.agents.get("a1", variant="full")
+
+    assert first is second
+    assert len(calls) == 2
+
+    # Outside the scope every call hits the network again.
+    client.agents.get("a1")
+    assert len(calls) == 3
+
+
+def test_get_many_uses_the_callers_request_scope(make_dust_client):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return _agents_handler(request)
+
+    client = make_dust_client(handler)
+
+    with client.request_scope():
+        first = client.agents.get("a1")
+        agents = client.agents.get_many(["a1", "a2"], max_workers=2)
+        again = client.agents.get("a2")
+
+    assert agents[0] is first
+    assert agents[1] is again
+    assert len(calls) == 2
+
+
+def test_picture_url_is_kept_as_string_and_validated_on_access():
+    agent = AgentConfiguration.model_validate(
+        dict(_agent_payload("a1"), pictureUrl="https://dust.tt/static/a1.png")
+    )
+
+    assert agent.pictureUrl == "https://dust.tt/static/a1.png"
+    assert str(agent.picture_url) == "https://dust.tt/static/a1.png"
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"agentConfigurations": [_agent_payload("a1")]},
+        [_agent_payload("a1")],
+        {"agents": [_agent_payload("a1")]},
+        {"agent_configurations": [_agent_payload("a1")]},
+        {"data": [_agent_payload("a1")]},
+    ],
+)
+def test_list_accepts_known_response_shapes(make_dust_client, body):
+    client = make_dust_client(lambda request: httpx.Response(200, json=body))
+
+    assert [a.sId for a in client.agents.list()] == ["a1"]
+
+
+@pytest.mark.parametrize("body", [42, {"unexpected": []}, {"agentConfigurations": 1}])
+def test_list_rejects_unknown_response_shapes(make_dust_client, body):
+    client = make_dust_client(lambda request: httpx.Response(200, json=body))
+
+    with pytest.raises(DustError, match="Failed to parse list agents response"):
+        client.agents.list()
@@ -5,9 +5,14 @@ from __future__ import annotations
 from typing import Iterator
 from types import SimpleNamespace
 
+import orjson
 import pytest
+from pydantic import ValidationError
 
+from dust_client._sse import EventFramer
+from dust_client.chat.exceptions import ChatError
 from dust_client.chat.models import ChatResponse
+from dust_client.conversations.client import ConversationsClient
 from dust_client.conversations.models import (
     Conversation,
     Message,
@@ -32,45 +37,56 @@ def _fake_user_message() -> Message:
     )
 
 
-def _fake_event_stream(user_msg_id: str) -> Iterator[ConversationEvent]:
-    """
-    Simulate the minimal sequence of events needed by ChatClient._wait_for_assistant_reply:
-
-      1) agent_message_new  -> to discover the agent message id via parentMessageId
-      2) agent_message_done -> to know the reply is finished
-    """
-    # Fake agent message with a parentMessageId pointing to the user message
-    agent_msg = Message(
-        sId="msg_agent_1",
-        conversation_sId="conv123",
-        content=None,
-        author_name="Assistant",
-        author_type="assistant",
-    )
-    # extra="allow" on Message means we can attach extra attributes
-    setattr(agent_msg, "parentMessageId", user_msg_id)
-
-    yield ConversationEvent(
-        type=ConversationEventType.AGENT_MESSAGE_NEW,
-        created=123,
-        messageId=None,
-        message=agent_msg,
+# Pre-encoded SSE frames for the minimal sequence of events needed by
+# ChatClient._wait_for_assistant_reply:
+#
+#   1) agent_message_new  -> to discover the agent message id via parentMessageId
+#   2) agent_message_done -> to know the reply is finished
+#
+# Built once; each replay runs the production framing + decoding path.
+_EVENT_BUFFER = b"".join(
+    b"data: " + orjson.dumps(frame) + b"\n\n"
+    for frame in (
+        {
+            "eventId": "1",
+            "data": {
+                "type": ConversationEventType.AGENT_MESSAGE_NEW.value,
+                "created": 123,
+                "message": {
+                    "sId": "msg_agent_1",
+                    "conversation_sId": "conv123",
+                    "author_name": "Assistant",
+                    "author_type": "assistant",
+                    "parentMessageId": "msg_user_1",
+                },
+            },
+        },
+        {
+            "eventId": "2",
+            "data": {
+                "type": ConversationEventType.AGENT_MESSAGE_DONE.value,
+                "created": 124,
+                "messageId": "msg_agent_1",
+            },
+        },
     )
+)
 
-    yield ConversationEvent(
-        type=ConversationEventType.AGENT_MESSAGE_DONE,
-        created=124,
-        messageId=agent_msg.sId,
-        message=None,
-    )
+
+def _fake_event_stream() -> Iterator[ConversationEvent]:
+    framer = EventFramer()
+    for payload in framer.feed(_EVENT_BUFFER):
+        decoded = ConversationsClient._decode_event(payload)
+        assert decoded is not None
+        yield decoded[1]
 
 
 def test_chat_send_creates_conv_and_aggregates_reply(chat_client, monkeypatch):
     """
     High-level test:
       - ChatClient.send() should:
-        * create a conversation when conversation_id=None
-        * create a user message
+        * create a conversation and the user message in one request
+          when conversation_id=None
         * stream events
         * re-fetch conversation and extract the agent reply
         * return a ChatResponse with assistant_message.text == "Hello world!"
@@ -79,25 +95,24 @@ def test_chat_send_creates_conv_and_aggregates_reply(chat_client, monkeypatch):
     conv = _fake_conversation()
     user_msg = _fake_user_message()
 
-    # 1) Patch ConversationsClient.create to return our fake conversation
-    def fake_create(title=None, blocking=True, extra=None):
-        return conv
-
-    # 2) Patch ConversationsClient.create_message to return our fake user message
-    def fake_create_message(conversation_id, content, mentions, context, extra=None):
-        assert conversation_id == conv.sId
+    # 1) Patch ConversationsClient.create_with_message: with conversation_id=None
+    #    the conversation and the user message are created in one request.
+    def fake_create_with_message(
+        content, mentions, context=None, title=None, blocking=True, extra=None
+    ):
         assert content == "Hello from ChatClient!"
+        assert title == "ChatClient demo"
         assert isinstance(mentions[0], MessageMention)
         assert isinstance(context, MessageContext)
-        return user_msg
+        return conv, user_msg
 
-    # 3) Patch ConversationsClient.stream_events to yield fake ConversationEvent objects
-    def fake_stream_events(conversation_id: str, timeout=None):
+    # 2) Patch ConversationsClient.stream_events to yield fake ConversationEvent objects
+    def fake_stream_events(conversation_id: str, timeout=None, background=True):
         assert conversation_id == conv.sId
         # NOTE: _fake_event_stream returns an *iterator*, so we just return it
-        return _fake_event_stream(user_msg.sId)
+        return _fake_event_stream()
 
-    # 4) Patch ConversationsClient.get to return a conversation whose content
+    # 3) Patch ConversationsClient.get to return a conversation whose content
     #    includes the final agent message text.
     #
     # ChatClient._wait_for_assistant_reply will look at conv.content, which in
@@ -128,9 +143,8 @@ def test_chat_send_creates_conv_and_aggregates_reply(chat_client, monkeypatch):
         return SimpleNamespace(sId=conv.sId, title=conv.title, content=conv_content)
 
     # Wire these patches into the ChatClient's conversations instance
-    monkeypatch.setattr(chat_client._conversations, "create", fake_create)
     monkeypatch.setattr(
-        chat_client._conversations, "create_message", fake_create_message
+        chat_client._conversations, "create_with_message", fake_create_with_message
     )
     monkeypatch.setattr(chat_client._conversations, "stream_events", fake_stream_events)
     monkeypatch.setattr(chat_client._conversations, "get", fake_get)
@@ -153,28 +167,596 @@ def test_chat_send_creates_conv_and_aggregates_reply(chat_client, monkeypatch):
     assert resp.assistant_message.text == "Hello world!"
     assert resp.assistant_message.message_id == "msg_agent_1"
 
+    # Chat results are immutable snapshots.
+    with pytest.raises(ValidationError):
+        resp.conversation_id = "other"
 
-def test_chat_send_requires_username(chat_client, monkeypatch):
-    """
-    username is required; ChatClient should raise DustError.
+    # Fixed schema: unknown fields are dropped rather than stored.
+    dumped = ChatResponse.model_validate(
+        {**resp.model_dump(), "unexpected": True}
+    ).model_dump()
+    assert "unexpected" not in dumped
 
-    We stub ConversationsClient.create so no real HTTP (or DummyDustClient stub failure)
-    occurs before the username validation kicks in.
+
+def test_chat_send_requires_username(chat_client, dummy_dust_client):
+    """
+    username is required; ChatClient should raise DustError before any
+    request is made.
     """
     from dust_client.exceptions import DustError
 
-    # Return a minimal conversation object when create() is called.
-    conv_stub = SimpleNamespace(sId="conv_stub")
-
-    monkeypatch.setattr(
-        chat_client._conversations,
-        "create",
-        lambda title=None, blocking=True, extra=None: conv_stub,
-    )
-
     with pytest.raises(DustError):
         chat_client.send(
             agent="helper",
             text="Hi",
             username="",  # invalid
         )
+    assert dummy_dust_client.calls == []
+
+
+def test_session_creates_conversation_lazily_on_first_send(chat_client, monkeypatch):
+    """
+    ChatClient.session() without conversation_id makes no request; the first
+    send() creates the conversation with its message, later sends reuse it.
+    """
+    conv = _fake_conversation()
+    calls = []
+
+    contexts = []
+
+    def fake_create_with_message(**kwargs):
+        calls.append(("create_with_message", kwargs["content"]))
+        contexts.append((kwargs["context"], kwargs["mentions"]))
+        return conv, _fake_user_message()
+
+    def fake_create_message(conversation_id, **kwargs):
+        calls.append(("create_message", conversation_id))
+        contexts.append((kwargs["context"], kwargs["mentions"]))
+        return _fake_user_message()
+
+    monkeypatch.setattr(
+        chat_client._conversations, "create_with_message", fake_create_with_message
+    )
+    monkeypatch.setattr(
+        chat_client._conversations, "create_message", fake_create_message
+    )
+    monkeypatch.setattr(chat_client, "_wait_for_assistant_reply", lambda **kwargs: None)
+
+    session = chat_client.session(agent="helper", username="leo", title="demo")
+    assert session.conversation_id is None
+    assert calls == []
+
+    session.send("first")
+    session.send("second")
+
+    assert session.conversation_id == conv.sId
+    assert calls == [("create_with_message", "first"), ("create_message", conv.sId)]
+
+    # Context and mentions are built once per session and reused.
+    assert contexts[0][0] is contexts[1][0]
+    assert contexts[0][1] is contexts[1][1]
+    assert contexts[0][0].username == "leo"
+    assert contexts[0][1][0].configurationId == "helper"
+
+
+def _reusing_chat_client(conversations_client, dummy_config, cache_path):
+    from dust_client.chat.client import ChatClient
+
+    config = dummy_config.model_copy(update={"conversation_cache_path": cache_path})
+    return ChatClient(conversations=conversations_client, agents=None, config=config)
+
+
+def test_session_reuse_resumes_conversation_across_clients(
+    conversations_client, dummy_config, tmp_path, monkeypatch
+):
+    cache_path = tmp_path / "conversations.db"
+    calls = []
+
+    def fake_create_with_message(**kwargs):
+        calls.append("create_with_message")
+        return _fake_conversation(), _fake_user_message()
+
+    def fake_create_message(conversation_id, **kwargs):
+        calls.append(("create_message", conversation_id))
+        return _fake_user_message()
+
+    monkeypatch.setattr(
+        conversations_client, "create_with_message", fake_create_with_message
+    )
+    monkeypatch.setattr(conversations_client, "create_message", fake_create_message)
+
+    first = _reusing_chat_client(conversations_client, dummy_config, cache_path)
+    monkeypatch.setattr(first, "_wait_for_assistant_reply", lambda **kwargs: None)
+    first.session(agent="helper", username="leo", title="demo", reuse=True).send("hi")
+    first.close()
+
+    # A new client (e.g. the next run of the script) picks the conversation up.
+    second = _reusing_chat_client(conversations_client, dummy_config, cache_path)
+    monkeypatch.setattr(second, "_wait_for_assistant_reply", lambda **kwargs: None)
+    session = second.session(agent="helper", username="leo", title="demo", reuse=True)
+    assert session.conversation_id == "conv123"
+    session.send("again")
+    second.close()
+
+    assert calls == ["create_with_message", ("create_message", "conv123")]
+
+
+def test_session_reuse_recreates_stale_conversation(
+    conversations_client, dummy_config, tmp_path, monkeypatch
+):
+    from dust_client.exceptions import DustNotFoundError
+
+    chat = _reusing_chat_client(
+        conversations_client, dummy_config, tmp_path / "conversations.db"
+    )
+    chat._remember_conversation("helper", "demo", "deleted_conv")
+    calls = []
+
+    def fake_create_message(conversation_id, **kwargs):
+        calls.append(("create_message", conversation_id))
+        raise DustNotFoundError(404, "conversation not found")
+
+    def fake_create_with_message(**kwargs):
+        calls.append("create_with_message")
+        return _fake_conversation(), _fake_user_message()
+
+    monkeypatch.setattr(conversations_client, "create_message", fake_create_message)
+    monkeypatch.setattr(
+        conversations_client, "create_with_message", fake_create_with_message
+    )
+    monkeypatch.setattr(chat, "_wait_for_assistant_reply", lambda **kwargs: None)
+
+    session = chat.session(agent="helper", username="leo", title="demo", reuse=True)
+    resp = session.send("hi")
+
+    assert calls == [("create_message", "deleted_conv"), "create_with_message"]
+    assert resp.conversation_id == "conv123"
+    assert (
+        chat.session(
+            agent="helper", username="leo", title="demo", reuse=True
+        ).conversation_id
+        == "conv123"
+    )
+    chat.close()
+
+
+def test_assistant_reply_is_built_from_streamed_tokens(chat_client, monkeypatch):
+    """When the stream carries the reply tokens, the conversation isn't re-fetched."""
+    user_msg = _fake_user_message()
+
+    def fake_stream_events(conversation_id, timeout=None, background=True):
+        agent_msg = Message(sId="msg_agent_1", parentMessageId=user_msg.sId)
+        yield ConversationEvent(type="agent_message_new", message=agent_msg)
+        for text, classification in [
+            ("thinking...", "chain_of_thought"),
+            ("Hello ", "tokens"),
+            ("world!", "tokens"),
+        ]:
+            yield ConversationEvent(
+                type="generation_tokens",
+                messageId="msg_agent_1",
+                text=text,
+                classification=classification,
+            )
+        yield ConversationEvent(type="agent_message_done", messageId="msg_agent_1")
+
+    def fail_get(conversation_id):
+        raise AssertionError("conversation should not be re-fetched")
+
+    monkeypatch.setattr(chat_client._conversations, "stream_events", fake_stream_events)
+    monkeypatch.setattr(chat_client._conversations, "get", fail_get)
+
+    reply = chat_client._wait_for_assistant_reply(
+        conversation_id="conv123", user_message_id=user_msg.sId, timeout=5.0
+    )
+
+    assert reply is not None
+    assert reply.text == "Hello world!"
+    assert reply.message_id == "msg_agent_1"
+
+
+def test_assistant_reply_uses_content_of_done_event(chat_client, monkeypatch):
+    """Without token events, the final content on agent_message_done is enough."""
+
+    def fake_stream_events(conversation_id, timeout=None, background=True):
+        agent_msg = Message(sId="msg_agent_1", parentMessageId="msg_user_1")
+        yield ConversationEvent(type="agent_message_new", message=agent_msg)
+        yield ConversationEvent(
+            type="agent_message_done",
+            messageId="msg_agent_1",
+            message=Message(sId="msg_agent_1", content="All done."),
+        )
+
+    def fail_get(conversation_id):
+        raise AssertionError("conversation should not be re-fetched")
+
+    monkeypatch.setattr(chat_client._conversations, "stream_events", fake_stream_events)
+    monkeypatch.setattr(chat_client._conversations, "get", fail_get)
+
+    reply = chat_client._wait_for_assistant_reply(
+        conversation_id="conv123", user_message_id="msg_user_1", timeout=5.0
+    )
+
+    assert reply is not None
+    assert reply.text == "All done."
+
+
+def test_asend_creates_conversation_and_aggregates_streamed_reply(make_dust_client):
+    import asyncio
+    import json
+
+    import httpx
+
+    events = [
+        {"type": "user_message_new", "messageId": "msg_user_1"},
+        {
+            "type": "agent_message_new",
+            "messageId": "msg_agent_1",
+            "message": {"sId": "msg_agent_1", "parentMessageId": "msg_user_1"},
+        },
+        {"type": "generation_tokens", "messageId": "msg_agent_1", "text": "Hi "},
+        {"type": "generation_tokens", "messageId": "msg_agent_1", "text": "there"},
+        {"type": "agent_message_done", "messageId": "msg_agent_1"},
+    ]
+    stream = b"".join(
+        b"data: " + json.dumps({"eventId": str(i), "data": e}).encode() + b"\n\n"
+        for i, e in enumerate(events)
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path.endswith("/assistant/conversations"):
+            return httpx.Response(
+                200,
+                json={
+                    "conversation": {"sId": "conv123"},
+                    "message": {"sId": "msg_user_1", "content": "Hello"},
+                },
+            )
+        if path.endswith("/assistant/conversations/conv123/events"):
+            return httpx.Response(200, content=stream)
+        return httpx.Response(404, json={"error": {"message": path}})
+
+    client = make_dust_client(handler)
+
+    resp = asyncio.run(
+        client.chat.asend(agent="helper", text="Hello", username="leo", timeout=5.0)
+    )
+
+    assert resp.conversation_id == "conv123"
+    assert resp.user_message.message_id == "msg_user_1"
+    assert resp.assistant_message is not None
+    assert resp.assistant_message.text == "Hi there"
+
+
+def test_send_returns_when_server_keeps_stream_open_after_reply(make_dust_client):
+    import json
+    import threading
+    import time
+
+    import httpx
+
+    events = [
+        {
+            "type": "agent_message_new",
+            "messageId": "msg_agent_1",
+            "message": {"sId": "msg_agent_1", "parentMessageId": "msg_user_1"},
+        },
+        {"type": "generation_tokens", "messageId": "msg_agent_1", "text": "Hi"},
+        {"type": "agent_message_done", "messageId": "msg_agent_1"},
+    ]
+    release = threading.Event()
+
+    def stream():
+        for i, e in enumerate(events):
+            yield b"data: " + json.dumps({"eventId": str(i), "data": e}).encode()
+            yield b"\n\n"
+        # Idle connection: nothing more until the test ends.
+        release.wait(timeout=10.0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={
+                    "conversation": {"sId": "conv123"},
+                    "message": {"sId": "msg_user_1", "content": "Hello"},
+                },
+            )
+        return httpx.Response(200, content=stream())
+
+    client = make_dust_client(handler)
+    try:
+        started = time.monotonic()
+        resp = client.chat.send(agent="helper", text="Hello", username="leo")
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert resp.assistant_message is not None
+    assert resp.assistant_message.text == "Hi"
+    assert elapsed < 0.5
+
+
+def test_send_batched_joins_texts_into_one_message(chat_client, monkeypatch):
+    sent = []
+
+    def fake_send_prebuilt(*, text, conversation_id, **kwargs):
+        sent.append(text)
+        return ChatResponse.model_construct(conversation_id="conv123")
+
+    monkeypatch.setattr(chat_client, "_send_prebuilt", fake_send_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    # A full batch is sent right away, without waiting for max_wait.
+    futures = [session.send_batched(t, max_wait=60, max_batch=3) for t in "abc"]
+    assert len({id(f) for f in futures}) == 1
+    assert futures[0].result(timeout=5.0).conversation_id == "conv123"
+    assert sent == ["a\nb\nc"]
+
+    # A partial batch is sent once max_wait elapses...
+    session.send_batched("d", max_wait=0.01).result(timeout=5.0)
+    assert sent[-1] == "d"
+
+    # ...or on flush().
+    session.send_batched("e", max_wait=60)
+    session.send_batched("f", max_wait=60)
+    session.flush()
+    assert sent[-1] == "e\nf"
+    assert session.flush() is None
+
+
+def test_send_batched_never_blocks_or_raises_and_serializes_sends(
+    chat_client, monkeypatch
+):
+    import threading
+
+    from dust_client.chat.exceptions import ChatError
+
+    release = threading.Event()
+    active = []
+    overlaps = []
+
+    def fake_send_prebuilt(*, text, conversation_id, **kwargs):
+        active.append(text)
+        overlaps.append(len(active))
+        try:
+            release.wait(timeout=5.0)
+            if text == "boom":
+                raise ChatError("agent failed")
+            return ChatResponse.model_construct(conversation_id="conv123")
+        finally:
+            active.remove(text)
+
+    monkeypatch.setattr(chat_client, "_send_prebuilt", fake_send_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    # Filling a batch hands it off instead of waiting for the round trip,
+    # and errors only surface through the future.
+    ok = session.send_batched("ok", max_batch=1)
+    failed = session.send_batched("boom", max_batch=1)
+    direct = threading.Thread(target=session.send, args=("direct",))
+    direct.start()
+
+    release.set()
+    direct.join(timeout=5.0)
+    assert ok.result(timeout=5.0).conversation_id == "conv123"
+    assert isinstance(failed.exception(timeout=5.0), ChatError)
+
+    # Batches and direct sends never ran at the same time.
+    assert max(overlaps) == 1
+
+
+def test_asend_batched_joins_concurrent_texts(chat_client, monkeypatch):
+    import asyncio
+
+    sent = []
+
+    async def fake_asend_prebuilt(*, text, conversation_id, **kwargs):
+        sent.append(text)
+        return ChatResponse.model_construct(conversation_id="conv123")
+
+    monkeypatch.setattr(chat_client, "_asend_prebuilt", fake_asend_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    async def main():
+        return await asyncio.gather(
+            *(session.asend_batched(t, max_wait=0.01) for t in ("x", "y", "z"))
+        )
+
+    responses = asyncio.run(main())
+
+    assert sent == ["x\ny\nz"]
+    assert [r.conversation_id for r in responses] == ["conv123"] * 3
+
+
+def test_concurrent_asend_creates_one_conversation(chat_client, monkeypatch):
+    import asyncio
+
+    seen = []
+
+    async def fake_asend_prebuilt(*, text, conversation_id, **kwargs):
+        seen.append(conversation_id)
+        await asyncio.sleep(0.01)
+        return ChatResponse.model_construct(
+            conversation_id=conversation_id or f"conv{len(seen)}"
+        )
+
+    monkeypatch.setattr(chat_client, "_asend_prebuilt", fake_asend_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    async def main():
+        return await asyncio.gather(session.asend("a"), session.asend("b"))
+
+    responses = asyncio.run(main())
+
+    assert seen == [None, "conv1"]
+    assert [r.conversation_id for r in responses] == ["conv1", "conv1"]
+    assert session.conversation_id == "conv1"
+
+
+def test_asend_batched_sends_full_batches_in_order(chat_client, monkeypatch):
+    import asyncio
+
+    sent = []
+    in_flight = []
+
+    async def fake_asend_prebuilt(*, text, conversation_id, **kwargs):
+        in_flight.append(text)
+        assert len(in_flight) == 1, "batches sent concurrently"
+        await asyncio.sleep(0.01)
+        in_flight.remove(text)
+        sent.append((text, conversation_id))
+        return ChatResponse.model_construct(conversation_id=conversation_id or "c1")
+
+    monkeypatch.setattr(chat_client, "_asend_prebuilt", fake_asend_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    async def main():
+        return await asyncio.gather(
+            *(session.asend_batched(t, max_batch=2) for t in "abcd")
+        )
+
+    asyncio.run(main())
+
+    assert sent == [("a\nb", None), ("c\nd", "c1")]
+
+
+def test_cancelled_asend_batched_caller_does_not_cancel_batch(chat_client, monkeypatch):
+    import asyncio
+
+    sent = []
+
+    async def fake_asend_prebuilt(*, text, conversation_id, **kwargs):
+        await asyncio.sleep(0.01)
+        sent.append(text)
+        return ChatResponse.model_construct(conversation_id="c1")
+
+    monkeypatch.setattr(chat_client, "_asend_prebuilt", fake_asend_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    async def main():
+        other = asyncio.create_task(session.asend_batched("x", max_wait=10))
+        await asyncio.sleep(0)
+        trigger = asyncio.create_task(session.asend_batched("y", max_batch=2))
+        await asyncio.sleep(0)
+        trigger.cancel()
+        return await other
+
+    resp = asyncio.run(main())
+
+    assert sent == ["x\ny"]
+    assert resp.conversation_id == "c1"
+
+
+def test_asend_batched_delivers_errors_to_every_caller(chat_client, monkeypatch):
+    import asyncio
+
+    async def fake_asend_prebuilt(**kwargs):
+        raise ChatError("boom")
+
+    monkeypatch.setattr(chat_client, "_asend_prebuilt", fake_asend_prebuilt)
+    session = chat_client.session(agent="helper", username="leo")
+
+    async def main():
+        return await asyncio.gather(
+            session.asend_batched("x", max_wait=0.01),
+            session.asend_batched("y", max_wait=0.01),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, ChatError) for r in results)
+
+
+def test_chat_session_has_no_instance_dict(chat_client):
+    session = chat_client.session(agent="helper", username="leo")
+
+    assert not hasattr(session, "__dict__")
+    with pytest.raises(AttributeError):
+        session.unknown = 1
+
+
+def test_agent_error_for_followed_message_raises_chat_error(chat_client, monkeypatch):
+    from dust_client.chat.exceptions import ChatError
+
+    def fake_stream_events(conversation_id, timeout=None, background=True):
+        agent_msg = Message(sId="msg_agent_1", parentMessageId="msg_user_1")
+        yield ConversationEvent(type="agent_message_new", message=agent_msg)
+        # Errors for other agent messages are ignored.
+        yield ConversationEvent(
+            type="agent_error", messageId="msg_other", error={"message": "nope"}
+        )
+        yield ConversationEvent(
+            type="agent_error", messageId="msg_agent_1", error={"message": "boom"}
+        )
+
+    monkeypatch.setattr(chat_client._conversations, "stream_events", fake_stream_events)
+
+    with pytest.raises(ChatError, match="boom"):
+        chat_client._wait_for_assistant_reply(
+            conversation_id="conv123", user_message_id="msg_user_1", timeout=5.0
+        )
+
+
+def test_session_warmup_creates_conversation_before_first_send(
+    chat_client, monkeypatch
+):
+    calls = []
+
+    def fake_create(*, title=None, **kwargs):
+        calls.append(("create", title))
+        return _fake_conversation()
+
+    def fake_create_message(conversation_id, **kwargs):
+        calls.append(("create_message", conversation_id))
+        return _fake_user_message()
+
+    monkeypatch.setattr(chat_client._conversations, "create", fake_create)
+    monkeypatch.setattr(
+        chat_client._conversations, "create_message", fake_create_message
+    )
+    monkeypatch.setattr(chat_client, "_wait_for_assistant_reply", lambda **kwargs: None)
+
+    session = chat_client.session(agent="helper", username="leo", title="demo")
+    assert session.warmup() is session
+    assert session.conversation_id == "conv123"
+    session.warmup()  # no-op once the conversation exists
+
+    session.send("hi")
+
+    assert calls == [("create", "demo"), ("create_message", "conv123")]
+
+
+def test_message_context_is_built_once_per_identity():
+    from dust_client.chat.client import _build_context
+
+    first = _build_context(agent="helper", username="leo", timezone="Europe/Paris")
+    again = _build_context(agent="helper", username="leo", timezone="Europe/Paris")
+    other = _build_context(agent="helper", username="ana", timezone="Europe/Paris")
+
+    assert first is again
+    assert other[0] is not first[0]
+
+    # Serialized exactly like validated models.
+    msg_context, (mention,) = first
+    assert msg_context.model_dump(exclude_none=True) == MessageContext(
+        username="leo", timezone="Europe/Paris"
+    ).model_dump(exclude_none=True)
+    assert mention.model_dump(exclude_none=True) == {
+        "configurationId": "helper",
+        "context": {"timezone": "Europe/Paris"},
+    }
+
+    # Shared between sends, so read-only.
+    assert isinstance(msg_context, MessageContext)
+    assert isinstance(first[1], tuple)
+    with pytest.raises(ValidationError):
+        msg_context.username = "mallory"
+    with pytest.raises(ValidationError):
+        mention.context.timezone = "UTC"
+
+    # Still validated once.
+    with pytest.raises(ValidationError):
+        _build_context(agent="helper", username=42, timezone=None)
@@ -0,0 +1,224 @@
+# tests/test_client.py
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+import httpx
+import pytest
+
+from dust_client.exceptions import (
+    DustAPIError,
+    DustError,
+    DustRateLimitError,
+    DustServerError,
+)
+
+
+def test_workspace_request_uses_shared_http_client(make_dust_client):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_dust_client(handler)
+
+    assert client.workspace_request("GET", "/assistant/agent_configurations") == {
+        "ok": True
+    }
+    assert client.workspace_request("GET", "assistant/conversations/c1") == {"ok": True}
+
+    assert seen == [
+        "/api/v1/w/w_test/assistant/agent_configurations",
+        "/api/v1/w/w_test/assistant/conversations/c1",
+    ]
+
+
+def test_context_manager_closes_pool(make_dust_client):
+    client = make_dust_client(lambda r: httpx.Response(200))
+
+    with client as c:
+        assert c is client
+        assert not client.http.is_closed
+
+    assert client.http.is_closed
+
+
+def test_prewarm_opens_connection_in_background(make_dust_client):
+    warmed = threading.Event()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        warmed.set()
+        return httpx.Response(405)
+
+    make_dust_client(handler, prewarm=True)
+
+    assert warmed.wait(timeout=5.0)
+    assert seen == [("HEAD", "/api/v1/w/w_test/assistant/agent_configurations")]
+
+
+def test_prewarm_failures_are_logged_at_debug_level(make_dust_client, caplog):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("TLS handshake failed", request=request)
+
+    with caplog.at_level(logging.DEBUG, logger="dust_client.client"):
+        make_dust_client(handler, prewarm=True)
+        for thread in threading.enumerate():
+            if thread.name == "dust-prewarm":
+                thread.join(timeout=5.0)
+
+    assert "Connection prewarm failed" in caplog.text
+    assert "TLS handshake failed" in caplog.text
+
+
+def test_no_prewarm_by_default(make_dust_client):
+    seen = []
+    make_dust_client(lambda request: seen.append(request) or httpx.Response(200))
+
+    assert seen == []
+
+
+def test_aworkspace_request_uses_async_client(make_dust_client):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_dust_client(handler)
+
+    async def main():
+        async with client:
+            return await client.aworkspace_request("GET", "/assistant/conversations")
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert seen == ["/api/v1/w/w_test/assistant/conversations"]
+    assert client.aio.is_closed
+
+
+def test_top_level_exports_are_imported_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from dust_client import DustConfig\n"
+        "assert 'dust_client.client' not in sys.modules\n"
+        "assert 'httpx' not in sys.modules\n"
+        "from dust_client import DustClient\n"
+        "assert 'dust_client.client' in sys.modules\n"
+        "assert 'dust_client.chat.client' not in sys.modules\n"
+        "client = DustClient(DustConfig(workspace_id='w', api_key='k'))\n"
+        "assert 'dust_client.agents.client' not in sys.modules\n"
+        "client.chat\n"
+        "assert 'dust_client.agents.client' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_api_errors_parse_body_lazily(make_dust_client):
+    body = b'{"error": {"type": "rate_limit_error", "message": "Slow down"}}'
+    client = make_dust_client(lambda request: httpx.Response(429, content=body))
+
+    with pytest.raises(DustRateLimitError) as exc_info:
+        client.workspace_request("GET", "/assistant/agent_configurations")
+
+    err = exc_info.value
+    assert err.status_code == 429
+    assert err._raw_body == body  # not parsed yet
+    assert err._rendered is None
+    assert str(err) == "Dust API error 429 [rate_limit_error]: Slow down"
+    assert err._rendered == str(err)  # rendered once, then reused
+    assert err.details == {
+        "error": {"type": "rate_limit_error", "message": "Slow down"}
+    }
+
+
+def test_api_error_attributes_stay_assignable_and_args_hold_the_message():
+    err = DustAPIError(
+        404, raw_body=b'{"error": {"code": "not_found", "message": "Gone"}}'
+    )
+
+    assert err.args == ("Dust API error 404 [not_found]: Gone",)
+    assert str(err.args[0]) == str(err)
+
+    err.message = "Conversation deleted"
+    err.code = None
+    err.details = {"conversationId": "c1"}
+
+    assert str(err) == "Dust API error 404: Conversation deleted"
+    assert err.args == (str(err),)
+    assert err.details == {"conversationId": "c1"}
+    assert repr(err) == "DustAPIError('Dust API error 404: Conversation deleted')"
+
+
+def test_api_errors_tolerate_non_json_bodies(make_dust_client):
+    client = make_dust_client(lambda request: httpx.Response(502, text="Bad gateway"))
+
+    with pytest.raises(DustServerError) as exc_info:
+        client.workspace_request("GET", "/assistant/agent_configurations")
+
+    assert exc_info.value.message == "Bad gateway"
+    assert exc_info.value.details == {"raw": "Bad gateway"}
+
+
+@pytest.mark.parametrize(
+    "body, code, message",
+    [
+        (b'{"code": "bad_input", "message": "Nope"}', "bad_input", "Nope"),
+        (b'{"error": "invalid_grant"}', "invalid_grant", "Unknown error"),
+        (b"[1, 2]", None, "Unknown error"),
+    ],
+)
+def test_api_errors_parse_other_body_shapes(make_dust_client, body, code, message):
+    client = make_dust_client(lambda request: httpx.Response(400, content=body))
+
+    with pytest.raises(DustAPIError) as exc_info:
+        client.workspace_request("GET", "/assistant/agent_configurations")
+
+    assert exc_info.value.code == code
+    assert exc_info.value.message == message
+
+
+def test_invalid_json_success_body_raises_dust_error(make_dust_client):
+    client = make_dust_client(lambda request: httpx.Response(200, content=b"{not json"))
+
+    with pytest.raises(DustError, match="Failed to parse JSON response"):
+        client.workspace_request("GET", "/assistant/agent_configurations")
+
+
+def test_json_bodies_are_sent_as_json(make_dust_client):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers["Content-Type"], request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_dust_client(handler)
+    client.workspace_request("POST", "/assistant/conversations", json={"title": "é"})
+
+    assert seen == [("application/json", '{"title":"é"}'.encode())]
+
+
+def test_default_headers_are_per_client_and_read_only(dummy_config):
+    from dust_client.client import DustClient
+
+    first = DustClient(dummy_config, user_agent_suffix="my-app/1.0")
+    second = DustClient(dummy_config, user_agent_suffix="my-app/1.0")
+    try:
+        assert first._headers == second._headers
+        assert first._headers is not second._headers
+        assert first._headers["User-Agent"] == "dust-sdk-py/0.1.0 my-app/1.0"
+        assert first._headers["Authorization"].startswith("Bearer ")
+        assert first.http.headers["Authorization"] == first._headers["Authorization"]
+
+        with pytest.raises(TypeError):
+            first._headers["X-Extra"] = "1"
+    finally:
+        first.close()
+        second.close()
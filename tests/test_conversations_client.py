@@ -8,8 +8,13 @@ from dust_client.conversations.models import (
     MessageMention,
     MessageMentionContext,
     MessageContext,
+    MessageDraft,
 )
 
+# Shared, read-only response payloads (never mutated by the tests).
+_CONVERSATION = {"sId": "abc123", "title": "SDK test"}
+_CONV_RESPONSE = {"conversation": _CONVERSATION}
+
 
 def test_create_conversation_builds_correct_request(
     dummy_dust_client, conversations_client
@@ -17,12 +22,7 @@ def test_create_conversation_builds_correct_request(
     dummy_dust_client.set_response(
         "POST",
         "/assistant/conversations",
-        {
-            "conversation": {
-                "sId": "abc123",
-                "title": "SDK test",
-            }
-        },
+        _CONV_RESPONSE,
     )
 
     conv = conversations_client.create(title="SDK test", blocking=True)
@@ -92,6 +92,37 @@ def test_create_message_builds_payload_and_parses_response(
     assert body["mentions"][0]["context"]["timezone"] == "Europe/Paris"
 
 
+def test_create_with_message_posts_conversation_and_message_together(
+    dummy_dust_client, conversations_client
+):
+    dummy_dust_client.set_response(
+        "POST",
+        "/assistant/conversations",
+        {
+            **_CONV_RESPONSE,
+            "message": {"sId": "msg123", "content": "Hello!"},
+        },
+    )
+
+    conv, msg = conversations_client.create_with_message(
+        title="SDK test",
+        content="Hello!",
+        mentions=[MessageMention(configurationId="helper")],
+        context=MessageContext(username="leo"),
+    )
+
+    assert conv.sId == "abc123"
+    assert msg.sId == "msg123"
+
+    assert len(dummy_dust_client.calls) == 1
+    body = dummy_dust_client.calls[0]["json"]
+    assert body["title"] == "SDK test"
+    assert body["blocking"] is True
+    assert body["message"]["content"] == "Hello!"
+    assert body["message"]["mentions"][0]["configurationId"] == "helper"
+    assert body["message"]["context"]["username"] == "leo"
+
+
 def test_cancel_messages_parses_success(dummy_dust_client, conversations_client):
     conv_id = "conv123"
     path = f"/assistant/conversations/{conv_id}/cancel"
@@ -108,3 +139,425 @@ def test_cancel_messages_parses_success(dummy_dust_client, conversations_client)
     call = dummy_dust_client.calls[0]
     assert call["path"] == path
     assert call["json"]["messageIds"] == ["m1", "m2"]
+
+
+def test_request_scope_refetches_conversation_after_write(
+    dummy_dust_client, conversations_client
+):
+    from dust_client._scope import request_scope
+
+    conv_path = "/assistant/conversations/conv123"
+    dummy_dust_client.set_response(
+        "GET", conv_path, {"conversation": {"sId": "conv123"}}
+    )
+    dummy_dust_client.set_response(
+        "POST", conv_path + "/messages", {"message": {"sId": "m1"}}
+    )
+
+    with request_scope():
+        conversations_client.get("conv123")
+        conversations_client.get("conv123")
+        assert len(dummy_dust_client.calls) == 1
+
+        conversations_client.create_message(
+            "conv123",
+            content="Hi",
+            mentions=[MessageMention(configurationId="helper")],
+        )
+        conversations_client.get("conv123")
+
+    assert [c["method"] for c in dummy_dust_client.calls] == ["GET", "POST", "GET"]
+
+
+def test_request_scope_refetches_conversation_after_concurrent_create_messages(
+    dummy_dust_client, conversations_client
+):
+    from dust_client._scope import request_scope
+
+    conv_path = "/assistant/conversations/conv123"
+    dummy_dust_client.set_response("GET", conv_path, _CONV_RESPONSE)
+    dummy_dust_client.set_response(
+        "POST", conv_path + "/messages", {"message": {"sId": "m"}}
+    )
+
+    mention = MessageMention(configurationId="helper")
+    drafts = [MessageDraft(content=text, mentions=[mention]) for text in "ab"]
+
+    with request_scope():
+        conversations_client.get("conv123")
+        conversations_client.create_messages("conv123", drafts, max_concurrency=2)
+        conversations_client.get("conv123")
+
+    methods = [c["method"] for c in dummy_dust_client.calls]
+    assert methods == ["GET", "POST", "POST", "GET"]
+
+
+def test_create_messages_posts_each_draft_in_order(
+    dummy_dust_client, conversations_client
+):
+    path = "/assistant/conversations/conv123/messages"
+    dummy_dust_client.set_response("POST", path, {"message": {"sId": "m"}})
+
+    mention = MessageMention(configurationId="helper")
+    drafts = [MessageDraft(content=text, mentions=[mention]) for text in "abc"]
+
+    msgs = conversations_client.create_messages("conv123", drafts)
+
+    assert len(msgs) == 3
+    assert [c["json"]["content"] for c in dummy_dust_client.calls] == ["a", "b", "c"]
+
+
+def test_acreate_messages_overlaps_requests(make_dust_client):
+    import asyncio
+    import json
+
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = json.loads(request.content)["content"]
+        return httpx.Response(200, json={"message": {"sId": f"m-{content}"}})
+
+    client = make_dust_client(handler)
+    mention = MessageMention(configurationId="helper")
+    drafts = [MessageDraft(content=text, mentions=[mention]) for text in "abc"]
+
+    msgs = asyncio.run(
+        client.conversations.acreate_messages("conv123", drafts, max_concurrency=3)
+    )
+
+    assert [m.sId for m in msgs] == ["m-a", "m-b", "m-c"]
+
+
+def test_stream_events_parses_envelopes_and_exposes_raw_payloads(make_dust_client):
+    import httpx
+
+    from dust_client.conversations.models import ConversationEventType
+
+    body = (
+        b'data: {"eventId": "1", "data": {"type": "user_message_new"}}\n\n'
+        b": ping\n\n"
+        b'data: {"type": "agent_message_done", "messageId": "m1"}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/w/w_test/assistant/conversations/c1/events"
+        return httpx.Response(200, content=body)
+
+    client = make_dust_client(handler)
+
+    events = list(client.conversations.stream_events("c1"))
+    raw = list(client.conversations.stream_events_raw("c1"))
+
+    assert [e.type for e in events] == [
+        ConversationEventType.USER_MESSAGE_NEW,
+        ConversationEventType.AGENT_MESSAGE_DONE,
+    ]
+    assert events[1].messageId == "m1"
+    assert raw == [
+        b'{"eventId": "1", "data": {"type": "user_message_new"}}',
+        b'{"type": "agent_message_done", "messageId": "m1"}',
+    ]
+
+
+def test_stream_events_sends_last_event_id_and_drops_replays(make_dust_client):
+    import asyncio
+
+    import httpx
+
+    body = b"".join(
+        b'data: {"eventId": "%s", "data": {"type": "generation_tokens"}}\n\n' % i
+        for i in (b"1", b"2", b"1", b"3")
+    )
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("Last-Event-ID"))
+        return httpx.Response(200, content=body)
+
+    client = make_dust_client(handler)
+
+    events = list(client.conversations.stream_events("c1", last_event_id="0"))
+
+    async def collect():
+        return [e async for e in client.conversations.astream_events("c1")]
+
+    aevents = asyncio.run(collect())
+
+    assert len(events) == len(aevents) == 3
+    assert seen_headers == ["0", None]
+
+
+def test_event_cursor_resumes_and_drops_replays_across_reconnects(make_dust_client):
+    import asyncio
+
+    import httpx
+
+    from dust_client.conversations.client import EventCursor
+
+    def frames(*ids):
+        return b"".join(
+            b'data: {"eventId": "%s", "data": {"type": "generation_tokens",'
+            b' "text": "%s"}}\n\n' % (i, i)
+            for i in ids
+        )
+
+    # Each connection replays everything from the start of the stream.
+    bodies = [
+        frames(b"1", b"2"),
+        frames(b"1", b"2", b"3"),
+        frames(b"1", b"2", b"3", b"4"),
+    ]
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("Last-Event-ID"))
+        return httpx.Response(200, content=bodies[len(seen_headers) - 1])
+
+    client = make_dust_client(handler)
+    cursor = EventCursor()
+
+    first = list(client.conversations.stream_events("c1", cursor=cursor))
+    second = list(client.conversations.stream_events("c1", cursor=cursor))
+
+    async def collect():
+        return [
+            e async for e in client.conversations.astream_events("c1", cursor=cursor)
+        ]
+
+    third = asyncio.run(collect())
+
+    assert [e.text for e in first] == ["1", "2"]
+    assert [e.text for e in second] == ["3"]
+    assert [e.text for e in third] == ["4"]
+    assert seen_headers == [None, "2", "3"]
+    assert cursor.last_event_id == "4"
+
+
+def test_cancel_messages_can_be_sent_mid_stream(make_dust_client):
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/events"):
+            return httpx.Response(
+                200,
+                content=(
+                    b'data: {"type": "agent_message_new", "messageId": "a1"}\n\n'
+                    b'data: {"type": "agent_message_done", "messageId": "a1"}\n\n'
+                ),
+            )
+        return httpx.Response(200, json={"success": True})
+
+    client = make_dust_client(handler)
+
+    seen = []
+    for event in client.conversations.stream_events("c1"):
+        seen.append(event.messageId)
+        if len(seen) == 1:
+            result = client.conversations.cancel_messages("c1", ["u1"])
+            assert result.success is True
+
+    assert seen == ["a1", "a1"]
+
+
+def test_decode_event_handles_envelopes_bare_events_and_junk():
+    import pytest
+
+    from dust_client.conversations.client import ConversationsClient
+    from dust_client.conversations.exceptions import ConversationError
+
+    decode = ConversationsClient._decode_event
+
+    event_id, event = decode(
+        b'{"eventId": "1", "data": {"type": "agent_message_done"}}'
+    )
+    assert (event_id, event.type) == ("1", "agent_message_done")
+
+    event_id, event = decode(b'{"type": "user_message_new"}')
+    assert (event_id, event.type) == (None, "user_message_new")
+    assert decode(b"not json") is None
+    assert decode(b"[1, 2]") is None
+
+    with pytest.raises(ConversationError):
+        decode(b'{"eventId": "1", "data": {"created": 1}}')
+
+
+def test_edit_message_serializes_mentions_without_nones(
+    dummy_dust_client, conversations_client
+):
+    path = "/assistant/conversations/conv123/messages/msg1/edit"
+    dummy_dust_client.set_response(
+        "POST", path, {"message": {"sId": "msg1", "content": "edited"}}
+    )
+
+    msg = conversations_client.edit_message(
+        "conv123",
+        "msg1",
+        content="edited",
+        mentions=[
+            MessageMention(configurationId="agent-1"),
+            MessageMention(
+                configurationId="agent-2",
+                context=MessageMentionContext(timezone="Europe/Paris"),
+            ),
+        ],
+    )
+
+    assert msg.content == "edited"
+    assert dummy_dust_client.calls[-1]["json"] == {
+        "content": "edited",
+        "mentions": [
+            {"configurationId": "agent-1"},
+            {"configurationId": "agent-2", "context": {"timezone": "Europe/Paris"}},
+        ],
+    }
+
+
+def test_message_payload_matches_create_message_payload_dump():
+    from dust_client.conversations.client import _message_payload
+    from dust_client.conversations.models import CreateMessagePayload
+
+    mentions = [
+        MessageMention(
+            configurationId="agent-1",
+            context=MessageMentionContext(timezone="Europe/Paris"),
+        )
+    ]
+    for context in (None, MessageContext(username="leo", queryType="history")):
+        expected = CreateMessagePayload(
+            content="Hi", mentions=mentions, context=context
+        ).model_dump(exclude_none=True)
+
+        assert _message_payload("Hi", mentions, context) == expected
+
+
+def test_merge_token_events_joins_runs_per_message_and_classification():
+    from dust_client.conversations.client import _merge_token_events
+    from dust_client.conversations.models import ConversationEvent
+
+    def tokens(message_id, text, classification="tokens"):
+        return ConversationEvent(
+            type="generation_tokens",
+            messageId=message_id,
+            text=text,
+            classification=classification,
+        )
+
+    merged = _merge_token_events(
+        [
+            tokens("m1", "thinking", "chain_of_thought"),
+            tokens("m1", "Hel"),
+            tokens("m1", "lo"),
+            tokens("m2", "!"),
+            ConversationEvent(type="agent_message_done", messageId="m1"),
+            tokens("m1", "late"),
+        ]
+    )
+
+    assert [(e.type, e.messageId, e.text) for e in merged[:3]] == [
+        ("generation_tokens", "m1", "thinking"),
+        ("generation_tokens", "m1", "Hello"),
+        ("generation_tokens", "m2", "!"),
+    ]
+    assert merged[3].type == "agent_message_done"
+    assert merged[4].text == "late"
+
+
+def test_stream_events_batch_tokens_preserves_text_and_order(make_dust_client):
+    import httpx
+
+    words = [f"w{i} " for i in range(50)]
+    body = b"".join(
+        b'data: {"eventId": "%d", "data": {"type": "generation_tokens", '
+        b'"messageId": "m1", "text": "%s"}}\n\n' % (i, w.encode())
+        for i, w in enumerate(words)
+    )
+    body += b'data: {"eventId": "done", "data": {"type": "agent_message_done"}}\n\n'
+
+    client = make_dust_client(lambda request: httpx.Response(200, content=body))
+
+    events = list(client.conversations.stream_events("c1", batch_tokens=True))
+
+    assert events[-1].type == "agent_message_done"
+    assert "".join(e.text for e in events[:-1]) == "".join(words)
+
+
+def test_parse_conversation_accepts_envelope_and_bare_shapes():
+    import pytest
+
+    from dust_client.conversations.client import ConversationsClient
+    from dust_client.conversations.exceptions import ConversationError
+
+    parse = ConversationsClient._parse_conversation
+
+    assert parse(b'{"conversation": {"sId": "c1"}}').sId == "c1"
+    assert parse(b'{"sId": "c2", "title": "bare"}').sId == "c2"
+
+    with pytest.raises(ConversationError, match="conversation"):
+        parse(b'{"title": "no id"}')
+    with pytest.raises(ConversationError, match="JSON object"):
+        parse(b"[]")
+
+    # Untyped fields (e.g. the message content) are kept as plain JSON.
+    conv = parse(b'{"conversation": {"sId": "c3", "content": [[{"sId": "m1"}]]}}')
+    assert conv.content == [[{"sId": "m1"}]]
+
+
+def test_create_message_accepts_plain_dict_mentions(
+    dummy_dust_client, conversations_client
+):
+    import pytest
+
+    from dust_client.conversations.exceptions import ConversationError
+
+    dummy_dust_client.set_response(
+        "POST",
+        "/assistant/conversations/conv123/messages",
+        {"message": {"sId": "msg1", "content": "Hi"}},
+    )
+
+    conversations_client.create_message(
+        "conv123",
+        content="Hi",
+        mentions=[
+            {"configurationId": "agent-1", "context": {"timezone": "UTC"}},
+            MessageMention(configurationId="agent-2"),
+        ],
+    )
+
+    assert dummy_dust_client.calls[-1]["json"]["mentions"] == [
+        {"configurationId": "agent-1", "context": {"timezone": "UTC"}},
+        {"configurationId": "agent-2"},
+    ]
+
+    with pytest.raises(ConversationError, match="configurationId"):
+        conversations_client.create_message(
+            "conv123", content="Hi", mentions=[{"agent": "oops"}]
+        )
+
+
+def test_astream_message_events_yields_json_objects(make_dust_client):
+    import asyncio
+
+    import httpx
+
+    body = (
+        b'data: {"type": "generation_tokens", "text": "Hi"}\n\n'
+        b"data: not json\n\n"
+        b'data: {"type": "agent_message_done"}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/conversations/c1/messages/m1/events")
+        return httpx.Response(200, content=body)
+
+    client = make_dust_client(handler)
+
+    async def collect():
+        return [
+            e async for e in client.conversations.astream_message_events("c1", "m1")
+        ]
+
+    assert asyncio.run(collect()) == [
+        {"type": "generation_tokens", "text": "Hi"},
+        {"type": "agent_message_done"},
+    ]
@@ -0,0 +1,165 @@
+# tests/test_utils.py
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+
+import httpx
+import pytest
+
+from dust_client._sse import EventFramer
+from dust_client.exceptions import DustError
+from dust_client.utils import (
+    iter_batches_in_thread,
+    iter_in_thread,
+    stream_sse_json,
+)
+
+
+def _streaming_http(chunks, status_code: int = 200) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Accept"] == "text/event-stream"
+        return httpx.Response(status_code, content=iter(chunks))
+
+    return httpx.Client(
+        base_url="https://example.test", transport=httpx.MockTransport(handler)
+    )
+
+
+def _collect(http: httpx.Client):
+    return list(stream_sse_json(http, method="GET", path="/events", timeout=5.0))
+
+
+def test_stream_sse_json_handles_events_split_across_chunks():
+    chunks = [
+        b": keep-alive\n\n",
+        b'data: {"eventId": "1", "da',
+        b'ta": {"type": "a"}}\n\ndata: {"eventId": "2"}\n',
+        b"\n",
+        b'{"ndjson": true}\r\n',
+        b"data: not json\n\n",
+        b'data: {"eventId": "3"}',
+    ]
+
+    events = _collect(_streaming_http(chunks))
+
+    assert events == [
+        {"eventId": "1", "data": {"type": "a"}},
+        {"eventId": "2"},
+        {"ndjson": True},
+        {"eventId": "3"},
+    ]
+
+
+def test_stream_sse_json_yields_each_event_as_soon_as_it_arrives():
+    produced = []
+
+    def chunks():
+        for i in range(3):
+            produced.append(i)
+            yield b'data: {"n": %d}\n\n' % i
+
+    events = stream_sse_json(
+        _streaming_http(chunks()), method="GET", path="/events", timeout=5.0
+    )
+
+    # Small events are not held back waiting for a larger read.
+    for i, event in enumerate(events):
+        assert event == {"n": i}
+        assert produced == list(range(i + 1))
+
+
+def test_stream_sse_json_raises_on_error_status():
+    with pytest.raises(DustError, match="status=500"):
+        _collect(_streaming_http([b"boom"], status_code=500))
+
+
+def test_iter_in_thread_preserves_order_and_reraises():
+    def source():
+        yield from range(100)
+        raise DustError("stream broke")
+
+    seen = []
+    with pytest.raises(DustError, match="stream broke"):
+        seen.extend(iter_in_thread(source(), maxsize=4))
+
+    assert seen == list(range(100))
+
+
+def test_iter_batches_in_thread_takes_everything_already_buffered():
+    release = threading.Event()
+
+    def source():
+        yield from range(5)
+        release.wait(timeout=5.0)
+        yield 5
+        raise DustError("stream broke")
+
+    batches = iter_batches_in_thread(source(), max_batch=3)
+    first = next(batches)
+    assert 1 <= len(first) <= 3
+
+    release.set()
+    seen = list(first)
+    with pytest.raises(DustError, match="stream broke"):
+        for batch in batches:
+            assert 1 <= len(batch) <= 3
+            seen.extend(batch)
+
+    assert seen == list(range(6))
+
+
+def test_iter_in_thread_closes_source_when_consumer_stops():
+    closed = threading.Event()
+
+    def source():
+        try:
+            yield from itertools.count()
+        finally:
+            closed.set()
+
+    items = iter_in_thread(source(), maxsize=2)
+    assert next(items) == 0
+    items.close()
+
+    assert closed.wait(timeout=5.0)
+
+
+def test_iter_in_thread_close_does_not_wait_for_a_blocked_reader():
+    release = threading.Event()
+    closed = threading.Event()
+
+    def source():
+        try:
+            yield 0
+            release.wait(timeout=10.0)  # idle connection
+            yield 1
+        finally:
+            closed.set()
+
+    items = iter_in_thread(source(), maxsize=2)
+    assert next(items) == 0
+
+    started = time.monotonic()
+    items.close()
+    assert time.monotonic() - started < 0.5
+
+    # The reader closes the source as soon as its pending read returns.
+    release.set()
+    assert closed.wait(timeout=5.0)
+
+
+def test_event_framer_is_independent_of_chunking():
+    stream = b': ping\n\ndata: {"a": 1}\r\n\r\ndata:\n{"b": 2}\ndata: {"c": 3}'
+    expected = [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+    for size in (1, 2, 7, len(stream)):
+        framer = EventFramer()
+        payloads = []
+        for i in range(0, len(stream), size):
+            payloads.extend(framer.feed(stream[i : i + size]))
+        payloads.extend(framer.flush())
+
+        assert payloads == expected